@@ -1,5 +1,4 @@
 """Base settings shared across Action Service components"""
-from functools import lru_cache
 from typing import Dict, Any, Optional
 import os
 from types import MappingProxyType
@@ -20,20 +19,21 @@ def create_mutable_reposet(**repos) -> Dict[str, Any]:
     """Create a new mutable repository set with arbitrary repositories"""
     return dict(repos)
 
-@lru_cache()
-def get_base_reposet() -> Dict[str, Any]:  # Change return type from RepoSet
+# Default repository set shared across components, built once at import
+_BASE_REPOSET: RepoSet = create_reposet(
+    webhook_repository=InMemoryWebhookRepository(),
+    event_repository=InMemoryEventRepository(),
+    result_repository=InMemoryResultRepository(),
+    action_repository=InMemoryActionRepository()
+)
+
+def get_base_reposet() -> RepoSet:
     """Get default repository set shared across components"""
-    webhook_repo = InMemoryWebhookRepository()
-    event_repo = InMemoryEventRepository()
-    result_repo = InMemoryResultRepository()
-    action_repo = InMemoryActionRepository()
-    
-    return {  # Return mutable dict instead of MappingProxyType
-        "webhook_repository": webhook_repo,
-        "event_repository": event_repo,
-        "result_repository": result_repo,
-        "action_repository": action_repo
-    }
+    return _BASE_REPOSET
+
+def get_mutable_base_reposet() -> Dict[str, Any]:
+    """Get a mutable copy of the default repository set for extension"""
+    return dict(_BASE_REPOSET)
 
 def validate_base_settings() -> None:
     """Validate common required environment variables"""
@@ -1,16 +1,20 @@
 """Action-related domain models"""
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from typing import List, Optional, Any
+from datetime import datetime
+from statistics import fmean
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Tuple
 
-from .config import ConfigValue, ProtocolConfigSchema
+from .config import ConfigValue, ProtocolConfig, ProtocolConfigSchema
 from .delivery import DeliveryAttempt, DeliveryPolicy
 from .metadata import MetadataField 
 from .metrics import Metric
 from .protocols import ActionType, Protocol
 from .templates import TransformRule
+from .base import private_slots, utc_now
 
-@dataclass
+@private_slots
+@dataclass(slots=True)
 class Action:
     """Definition of something the service can do"""
     id: str
@@ -26,10 +30,47 @@ class Action:
     schedule: Optional[str] = None  # Cron expression for polling/subscriptions
     input_transform: Optional[TransformRule] = None  # Transformation rules
     output_transform: Optional[TransformRule] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: Optional[datetime] = None  # Defaults to construction time
+    updated_at: Optional[datetime] = None
+    # Lazily built name indexes, keyed on a snapshot of the indexed contents so
+    # both reassignment and in-place edits invalidate them
+    _config_index: Optional[Tuple[Tuple[ConfigValue, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _metadata_index: Optional[Tuple[Tuple[MetadataField, ...], Dict[str, MetadataField]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-@dataclass
+    def __post_init__(self):
+        # Read the clock once for both timestamps
+        if self.created_at is None or self.updated_at is None:
+            now = utc_now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
+
+    def get_config(self, name: str, default: Any = None) -> Any:
+        """Get a config value by name whatever shape config takes"""
+        config = self.config
+        if isinstance(config, (Mapping, ProtocolConfig)):
+            return config.get(name, default)
+        # Matching snapshots compare element by identity, so a hit costs one pass
+        key = tuple(config)
+        index = getattr(self, '_config_index', None)  # Unset when built by pydantic
+        if index is None or index[0] != key:
+            index = self._config_index = (key, {v.name: v.value for v in key})
+        return index[1].get(name, default)
+
+    def get_metadata(self, name: str) -> Optional[MetadataField]:
+        """Get a metadata field by name"""
+        key = tuple(self.metadata)
+        index = getattr(self, '_metadata_index', None)  # Unset when built by pydantic
+        if index is None or index[0] != key:
+            index = self._metadata_index = (key, {m.name: m for m in key})
+        return index[1].get(name)
+
+@dataclass(slots=True)
 class ActionResult:
     """Result of executing an action"""
     action_id: str
@@ -41,5 +82,34 @@ class ActionResult:
     history: List[Metric] = field(default_factory=list)
     limits: List[Metric] = field(default_factory=list)
     context: List[Metric] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=utc_now)
     completed_at: Optional[datetime] = None
+
+@dataclass(slots=True)
+class BulkActionResult:
+    """Columnar metric history across many results, for bulk aggregation"""
+    history: Dict[str, array] = field(default_factory=dict)  # Metric name -> float64 samples
+    result_count: int = 0
+
+    @classmethod
+    def from_results(cls, results: Iterable[ActionResult]) -> "BulkActionResult":
+        bulk = cls()
+        for result in results:
+            bulk.add(result)
+        return bulk
+
+    def add(self, result: ActionResult) -> None:
+        """Append the numeric history metrics of a result"""
+        history = self.history
+        for metric in result.history:
+            if isinstance(metric.value, (int, float)):
+                column = history.get(metric.name)
+                if column is None:
+                    column = history[metric.name] = array('d')
+                column.append(metric.value)
+        self.result_count += 1
+
+    def mean(self, name: str) -> Optional[float]:
+        """Average of all samples recorded for a metric"""
+        column = self.history.get(name)
+        return fmean(column) if column else None
@@ -1,80 +1,139 @@
 """Base types used throughout the domain model."""
+from dataclasses import dataclass, field, fields, FrozenInstanceError, MISSING
+from datetime import datetime, UTC
+import importlib
+import sys
+from typing import Iterable
 
-from dataclasses import dataclass
-from typing import Union, Optional, Any
+# Caching convention for domain objects: never put functools.lru_cache/cache on
+# a method, since the cache holds a strong reference to every ``self`` it has
+# seen. Keep per-instance caches in private ``init=False`` slots (see
+# ``Action.get_config`` and ``ProtocolConfigSchema``) or key a module-level
+# cache on hashable field values, falling back to the uncached path when a
+# value is unhashable. Classes with such slots are wrapped in ``private_slots``
+# (``fast_frozen_dataclass`` does this itself) so the caches are not fields.
 
-@dataclass(frozen=True)
-class Metric:
-    """A single named value with optional description"""
-    name: str
-    value: Union[str, int, float, bool]
-    description: Optional[str] = None
+_HAS_DEFAULT_FACTORY = object()
 
-@dataclass(frozen=True)
-class MetadataField:
-    """A strongly-typed metadata field with context"""
-    name: str
-    value: Any
-    category: str  # e.g. "system", "user", "audit"
-    description: Optional[str] = None
+
+def utc_now() -> datetime:
+    """Current time in UTC, usable directly as a dataclass default_factory"""
+    return datetime.now(UTC)
+
+
+def _raise_frozen(self, name, value=None):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def private_slots(cls):
+    """Drop private ``init=False`` fields of a slotted dataclass from its fields.
+
+    The slots stay and are still filled by ``__init__`` and ``__post_init__``,
+    but ``dataclasses.fields``/``asdict`` and pydantic serialization no longer
+    see them, so cached state never ends up in API output. Pickling and
+    copying keep every set slot.
+    """
+    dataclass_fields = cls.__dataclass_fields__
+    for name in [name for name, f in dataclass_fields.items() if name.startswith('_') and not f.init]:
+        del dataclass_fields[name]
+    slots = cls.__slots__
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in slots if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    __getstate__.__qualname__ = f'{cls.__qualname__}.__getstate__'
+    __setstate__.__qualname__ = f'{cls.__qualname__}.__setstate__'
+    cls.__getstate__ = __getstate__
+    cls.__setstate__ = __setstate__
+    return cls
+
+
+def fast_frozen_dataclass(cls=None, /, *, intern: Iterable[str] = ()):
+    """Slotted, immutable dataclass with a cheap __init__ and cached hash.
+
+    ``frozen=True`` routes every assignment in ``__init__`` through
+    ``object.__setattr__``; here the generated ``__init__`` writes straight
+    to the slot descriptors instead, and ``__hash__`` is computed once and
+    kept in a private ``_hash`` slot. String values of the fields named in
+    ``intern`` are passed through ``sys.intern``.
+    """
+    if cls is None:
+        return lambda cls: fast_frozen_dataclass(cls, intern=intern)
+    intern = frozenset(intern)
+    cls.__annotations__ = {**cls.__dict__.get('__annotations__', {}), '_hash': int}
+    cls._hash = field(init=False, repr=False, compare=False, hash=False)
+    cls = dataclass(slots=True)(cls)
+    del cls.__dataclass_fields__['_hash']
+
+    flds = fields(cls)  # Private slots included, so __init__ and pickling cover them
+    private_slots(cls)
+    ns = {'_HAS_DEFAULT_FACTORY': _HAS_DEFAULT_FACTORY, '_intern': sys.intern}
+    args, body = [], []
+    for f in flds:
+        setter = f'_set_{f.name}'
+        ns[setter] = getattr(cls, f.name).__set__
+        default = f'_dflt_{f.name}'
+        if f.default is not MISSING:
+            ns[default] = f.default
+            value = f.name if f.init else default
+            if f.init:
+                args.append(f'{f.name}={default}')
+        elif f.default_factory is not MISSING:
+            ns[default] = f.default_factory
+            if f.init:
+                args.append(f'{f.name}=_HAS_DEFAULT_FACTORY')
+                value = f'{default}() if {f.name} is _HAS_DEFAULT_FACTORY else {f.name}'
+            else:
+                value = f'{default}()'
+        elif f.init:
+            args.append(f.name)
+            value = f.name
+        else:
+            continue  # Left unset for __post_init__ to fill in
+        if f.name in intern:
+            body.append(f'    {f.name} = {value}')
+            value = f'_intern({f.name}) if {f.name}.__class__ is str else {f.name}'
+        body.append(f'    {setter}(self, {value})')
+    if hasattr(cls, '__post_init__'):
+        body.append('    self.__post_init__()')
+    ns['_set__hash'] = cls._hash.__set__
+    key = ''.join(f'self.{f.name},' for f in flds if f.compare and f.hash is not False)
+    src = (
+        f"def __init__(self, {', '.join(args)}):\n" + ('\n'.join(body) or '    pass') + '\n'
+        'def __hash__(self):\n'
+        '    try:\n'
+        '        return self._hash\n'
+        '    except AttributeError:\n'
+        f'        h = hash(({key}))\n'
+        '        _set__hash(self, h)\n'
+        '        return h\n'
+        'def __getstate__(self):\n'
+        f"    return [{', '.join(f'self.{f.name}' for f in flds)}]\n"
+        'def __setstate__(self, state):\n'
+        f"    for setter, value in zip(({''.join(f'_set_{f.name},' for f in flds)}), state):\n"
+        '        setter(self, value)\n'
+    )
+    exec(src, ns)
+    for name in ('__init__', '__hash__', '__getstate__', '__setstate__'):
+        ns[name].__qualname__ = f'{cls.__qualname__}.{name}'
+        setattr(cls, name, ns[name])
+    cls.__setattr__ = _raise_frozen
+    cls.__delattr__ = _raise_frozen
+    return cls
+
+# Re-exported from their canonical modules, resolved on first access since
+# those modules build their classes with fast_frozen_dataclass
+_REEXPORTS = {'Metric': '.metrics', 'MetadataField': '.metadata'}
+
+
+def __getattr__(name):
+    module = _REEXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __package__), name)
 
 __all__ = ['Metric', 'MetadataField']
-"""Base domain types used across other domain models"""
-
-from dataclasses import dataclass
-from typing import Any, Dict, Union, Optional
-
-@dataclass(frozen=True)
-class Metric:
-    """A single named value with optional description"""
-    name: str
-    value: Union[str, int, float, bool]
-    description: Optional[str] = None
-
-@dataclass(frozen=True)
-class ValidationRule:
-    """Defines validation rules for configuration values"""
-    rule_type: str  # e.g. "min", "max", "pattern", "choices", "range"
-    value: Any  # The validation constraint value
-    message: Optional[str] = None  # Custom error message
-
-@dataclass(frozen=True)
-class ConfigValue:
-    """A strongly-typed configuration value"""
-    name: str
-    value: Union[str, int, bool, float]  # Only primitive scalar types
-    description: Optional[str] = None
-
-@dataclass(frozen=True)
-class MetadataField:
-    """A strongly-typed metadata field with context"""
-    name: str
-    value: Any
-    category: str  # e.g. "system", "user", "audit"
-    description: Optional[str] = None
-
-@dataclass(frozen=True)
-class TransformRule:
-    """A data transformation rule"""
-    name: str
-    transform_type: str  # e.g. "map", "filter", "aggregate"
-    config: Dict[str, Any]
-    description: Optional[str] = None
-"""Base domain types used across other modules"""
-from dataclasses import dataclass
-from typing import Any, Optional, Union
-
-@dataclass(frozen=True)
-class Metric:
-    """A single named value with optional description"""
-    name: str
-    value: Union[str, int, float, bool]
-    description: Optional[str] = None
-
-@dataclass(frozen=True)
-class MetadataField:
-    """A strongly-typed metadata field with context"""
-    name: str
-    value: Any
-    category: str  # e.g. "system", "user", "audit"
-    description: Optional[str] = None
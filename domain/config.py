@@ -1,352 +1,236 @@
-"""Configuration related domain classes."""
-
+"""Configuration-related domain models"""
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union, Literal
-
-@dataclass(frozen=True)
-class ConfigValue:
-    """A strongly-typed configuration value"""
-    name: str
-    value: Union[str, int, bool, float]  # Only primitive scalar types
-    description: Optional[str] = None
-
-@dataclass(frozen=True)
+from functools import lru_cache
+import operator
+import re
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Any, Tuple, Union, Literal
+from .base import fast_frozen_dataclass, private_slots
+
+def _instance_of(base: type) -> Callable[[Any], bool]:
+    return lambda value: isinstance(value, base)
+
+def _is_int(value: Any) -> bool:
+    """Int subclasses such as IntEnum pass, bool does not"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+# Type name -> (exact classes accepted, fallback check for other classes).
+_TYPE_MAP: Dict[str, Tuple[FrozenSet[type], Optional[Callable[[Any], bool]]]] = {
+    "str": (frozenset({str}), _instance_of(str)),
+    "int": (frozenset({int}), _is_int),
+    "bool": (frozenset({bool}), None),
+    "float": (frozenset({float}), _instance_of(float)),
+    "dict": (frozenset({dict}), _instance_of(dict)),
+    "list": (frozenset({list}), _instance_of(list)),
+}
+# (exact types, fallback check, type name, [(rule predicate, error message)])
+_CompiledField = Tuple[FrozenSet[type], Optional[Callable[[Any], bool]], str, List[Tuple[Callable[[Any], bool], str]]]
+_REORDER_EVERY = 64  # Failures between re-sorting field checks by failure count
+_VALIDATED_CACHE_SIZE = 1024  # Successfully validated configs remembered per schema
+_COMPILED_SCHEMAS_SIZE = 256  # Distinct schemas whose compiled checks are shared
+_COMPILED_SCHEMAS: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+_MISSING = object()
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a rule pattern once per distinct pattern string"""
+    return re.compile(pattern)
+
+@fast_frozen_dataclass(intern=('rule_type',))
 class ValidationRule:
     """Defines validation rules for configuration values"""
     rule_type: str  # e.g. "min", "max", "pattern", "choices", "range"
     value: Any  # The validation constraint value
     message: Optional[str] = None  # Custom error message
+    _pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass(frozen=True)
-class PropertyDefinition:
-    """Schema definition for a single configuration property"""
-    type: Literal["str", "int", "bool", "float"]  # Only allow specific primitive types
-    description: Optional[str] = None
-    default: Optional[Any] = None
-    required: bool = False
-    validation_rules: List[ValidationRule] = field(default_factory=list)
-
-@dataclass(frozen=True)
-class ProtocolConfigSchema:
-    """Schema definition for protocol configuration"""
-    properties: Dict[str, PropertyDefinition]
-    required: List[str]
-    description: Optional[str] = None
-    
     def __post_init__(self):
-        # Validate that required fields exist in properties
-        missing = [field for field in self.required if field not in self.properties]
-        if missing:
-            raise ValueError(f"Required fields missing from properties: {', '.join(missing)}")
-        
-        # Validate property definitions
-        for field_name, field_def in self.properties.items():
-            if not isinstance(field_def, PropertyDefinition):
-                raise ValueError(f"Field {field_name} must use PropertyDefinition")
-
-    def validate_config(self, config: Dict[str, Any]) -> None:
-        """Validate a configuration against this schema"""
-        # Check required fields
-        missing = [field for field in self.required if field not in config]
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
-            
-        # Validate field types
-        for field_name, value in config.items():
-            if field_name not in self.properties:
-                raise ValueError(f"Unknown field: {field_name}")
-                
-            prop_def = self.properties[field_name]
-            expected_type = eval(prop_def.type)  # Safe since type is from Literal
-            if not isinstance(value, expected_type):
-                raise ValueError(f"Field {field_name} must be of type {prop_def.type}")
-            
-            # Apply validation rules if any
-            for rule in prop_def.validation_rules:
-                if not self._validate_rule(value, rule):
-                    raise ValueError(
-                        rule.message or f"Field {field_name} failed validation rule: {rule.rule_type}"
-                    )
+        if self.rule_type == "pattern":
+            object.__setattr__(self, '_pattern', _compile_pattern(self.value))
 
-    def _validate_rule(self, value: Any, rule: ValidationRule) -> bool:
-        """Apply a validation rule to a value"""
-        if rule.rule_type == "min":
-            return value >= rule.value
-        elif rule.rule_type == "max":
-            return value <= rule.value
-        elif rule.rule_type == "pattern":
-            import re
-            return bool(re.match(rule.value, str(value)))
-        elif rule.rule_type == "choices":
-            return value in rule.value
-        elif rule.rule_type == "range":
-            min_val, max_val = rule.value
-            return min_val <= value <= max_val
-        return False  # Unknown rule type
-
-__all__ = ['ConfigValue', 'ValidationRule', 'PropertyDefinition', 'ProtocolConfigSchema']
-"""Configuration-related domain classes"""
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, Literal
-
-@dataclass(frozen=True)
-class ValidationRule:
-    """Defines validation rules for configuration values"""
-    rule_type: str  # e.g. "min", "max", "pattern", "choices", "range"
-    value: Any  # The validation constraint value
-    message: Optional[str] = None  # Custom error message
-
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('name',))
 class ConfigValue:
     """A strongly-typed configuration value"""
     name: str
     value: Union[str, int, bool, float]  # Only primitive scalar types
     description: Optional[str] = None
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('type',))
 class PropertyDefinition:
     """Schema definition for a single configuration property"""
-    type: Literal["str", "int", "bool", "float"]  # Only allow specific primitive types
+    type: Literal["str", "int", "bool", "float", "dict", "list"]  # Keys of _TYPE_MAP
     description: Optional[str] = None
     default: Optional[Any] = None
     required: bool = False
-    validation_rules: List[ValidationRule] = field(default_factory=list)
+    validation_rules: Tuple[ValidationRule, ...] = ()
 
-@dataclass(frozen=True)
+    def __post_init__(self):
+        if not isinstance(self.validation_rules, tuple):
+            object.__setattr__(self, 'validation_rules', tuple(self.validation_rules))
+
+def _in_range(value: Any, bounds: Tuple[Any, Any]) -> bool:
+    min_val, max_val = bounds
+    return min_val <= value <= max_val
+
+def _matches(value: Any, pattern: re.Pattern) -> bool:
+    return pattern.match(value if isinstance(value, str) else str(value)) is not None
+
+# Rule type -> predicate(value, constraint)
+_RULE_HANDLERS: Dict[str, Callable[[Any, Any], bool]] = {
+    "min": operator.ge,
+    "max": operator.le,
+    "pattern": _matches,
+    "choices": lambda value, choices: value in choices,
+    "range": _in_range,
+}
+
+def _compile_rule(rule: ValidationRule) -> Callable[[Any], bool]:
+    """Bind a validation rule to a single-argument predicate"""
+    handler = _RULE_HANDLERS.get(rule.rule_type)
+    if handler is None:
+        return lambda value: False  # Unknown rule type
+    constraint = rule._pattern if rule.rule_type == "pattern" else rule.value
+    return lambda value: handler(value, constraint)
+
+def _compile_properties(
+    properties: Dict[str, PropertyDefinition]
+) -> Dict[str, _CompiledField]:
+    """Validate property definitions and compile them into per-field checks"""
+    compiled = {}
+    for field_name, field_def in properties.items():
+        if not isinstance(field_def, PropertyDefinition):
+            raise ValueError(f"Field {field_name} must use PropertyDefinition")
+        if field_def.type not in _TYPE_MAP:
+            raise ValueError(f"Field {field_name} has unsupported type: {field_def.type}")
+        checks = [
+            (
+                _compile_rule(rule),
+                rule.message or f"Field {field_name} failed validation rule: {rule.rule_type}",
+            )
+            for rule in field_def.validation_rules
+        ]
+        compiled[field_name] = (*_TYPE_MAP[field_def.type], field_def.type, checks)
+    return compiled
+
+@private_slots
+@dataclass(frozen=True, slots=True)
 class ProtocolConfigSchema:
     """Schema definition for protocol configuration"""
     properties: Dict[str, PropertyDefinition]  # Use PropertyDefinition instead of Dict[str, Any]
-    required: List[str]  # Required field names
+    required: Tuple[str, ...]  # Required field names
     description: Optional[str] = None
-    supported_patterns: List[str] = field(default_factory=lambda: ["single"])  # single, stream, batch
-    pattern_config: Dict[str, Dict[str, PropertyDefinition]] = field(default_factory=dict)  # Pattern-specific config
+    _required_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _compiled: Dict[str, _CompiledField] = field(
+        init=False, repr=False, compare=False
+    )
+    _check_order: Tuple[Tuple[Any, ...], ...] = field(init=False, repr=False, compare=False)  # (name, *_CompiledField)
+    _fail_counts: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _validated: set = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        # Validate that required fields exist in properties
-        missing = [field for field in self.required if field not in self.properties]
-        if missing:
-            raise ValueError(f"Required fields missing from properties: {', '.join(missing)}")
-        
-        # Validate property definitions
-        for field_name, field_def in self.properties.items():
-            if not isinstance(field_def, PropertyDefinition):
-                raise ValueError(f"Field {field_name} must use PropertyDefinition")
+        if not isinstance(self.required, tuple):
+            object.__setattr__(self, 'required', tuple(self.required))
+        # Copy so later edits to the caller's dict cannot change the schema
+        object.__setattr__(self, 'properties', dict(self.properties))
+
+        # Identical schemas share one checked and compiled property table
+        try:
+            key = (self.required, tuple(self.properties.items()))
+            compiled = _COMPILED_SCHEMAS.get(key)
+        except TypeError:  # Unhashable property defaults or rule values
+            key = compiled = None
+
+        if compiled is None:
+            # Validate that required fields exist in properties
+            missing = [field for field in self.required if field not in self.properties]
+            if missing:
+                raise ValueError(f"Required fields missing from properties: {', '.join(missing)}")
+            compiled = _compile_properties(self.properties)
+            if key is not None:
+                if len(_COMPILED_SCHEMAS) >= _COMPILED_SCHEMAS_SIZE:
+                    _COMPILED_SCHEMAS.clear()
+                _COMPILED_SCHEMAS[key] = compiled
+
+        object.__setattr__(self, '_required_set', frozenset(self.required))
+        object.__setattr__(self, '_compiled', compiled)
+        object.__setattr__(self, '_check_order', tuple((name, *checks) for name, checks in compiled.items()))
+        object.__setattr__(self, '_fail_counts', dict.fromkeys(compiled, 0))
+        object.__setattr__(self, '_validated', set())
 
     def validate_config(self, config: Dict[str, Any]) -> None:
         """Validate a configuration against this schema"""
+        # Configs that already passed are remembered; the value type is part of
+        # the key so that e.g. 1 and True are not treated as the same config
+        try:
+            key = frozenset((name, type(value), value) for name, value in config.items())
+        except TypeError:  # Unhashable values are validated every time
+            key = None
+        if key is not None and key in self._validated:
+            return
+
         # Check required fields
-        missing = [field for field in self.required if field not in config]
-        if missing:
+        if not self._required_set <= config.keys():
+            missing = [field for field in self.required if field not in config]
             raise ValueError(f"Missing required fields: {', '.join(missing)}")
             
-        # Validate field types
-        for field_name, value in config.items():
-            if field_name not in self.properties:
-                raise ValueError(f"Unknown field: {field_name}")
-                
-            prop_def = self.properties[field_name]
-            expected_type = eval(prop_def.type)  # Safe since type is from Literal
-            if not isinstance(value, expected_type):
-                raise ValueError(f"Field {field_name} must be of type {prop_def.type}")
+        # Reject unknown fields before any per-field work
+        compiled = self._compiled
+        if not config.keys() <= compiled.keys():
+            unknown = next(field for field in config if field not in compiled)
+            raise ValueError(f"Unknown field: {unknown}")
+
+        # Validate field types and rules, most frequently failing fields first
+        for field_name, exact_types, fallback, type_name, checks in self._check_order:
+            value = config.get(field_name, _MISSING)
+            if value is _MISSING:
+                continue
+            if value.__class__ not in exact_types and (fallback is None or not fallback(value)):
+                raise self._failure(field_name, f"Field {field_name} must be of type {type_name}")
             
-            # Apply validation rules if any
-            for rule in prop_def.validation_rules:
-                if not self._validate_rule(value, rule):
-                    raise ValueError(
-                        rule.message or f"Field {field_name} failed validation rule: {rule.rule_type}"
-                    )
-
-    def _validate_rule(self, value: Any, rule: ValidationRule) -> bool:
-        """Apply a validation rule to a value"""
-        if rule.rule_type == "min":
-            return value >= rule.value
-        elif rule.rule_type == "max":
-            return value <= rule.value
-        elif rule.rule_type == "pattern":
-            import re
-            return bool(re.match(rule.value, str(value)))
-        elif rule.rule_type == "choices":
-            return value in rule.value
-        elif rule.rule_type == "range":
-            min_val, max_val = rule.value
-            return min_val <= value <= max_val
-        return False  # Unknown rule type
-
-@dataclass(frozen=True)
+            for check, message in checks:
+                if not check(value):
+                    raise self._failure(field_name, message)
+
+        if key is not None:
+            if len(self._validated) >= _VALIDATED_CACHE_SIZE:
+                self._validated.clear()
+            self._validated.add(key)
+
+    def _failure(self, field_name: str, message: str) -> ValueError:
+        """Record a failed field check and build its error"""
+        counts = self._fail_counts
+        counts[field_name] += 1
+        if sum(counts.values()) % _REORDER_EVERY == 0:
+            # Swap in a new tuple so concurrent validations keep a stable order
+            order = tuple(sorted(self._check_order, key=lambda entry: -counts[entry[0]]))
+            object.__setattr__(self, '_check_order', order)
+        return ValueError(message)
+
+@private_slots
+@dataclass(frozen=True, slots=True)
 class ProtocolConfig:
     """Configuration for a protocol instance"""
     values: List[ConfigValue]
     schema: ProtocolConfigSchema
+    _as_dict: Mapping[str, Any] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate config against schema on creation"""
         config_dict = {v.name: v.value for v in self.values}
+        if len(config_dict) != len(self.values):
+            seen = set()
+            duplicate = next(v.name for v in self.values if v.name in seen or seen.add(v.name))
+            raise ValueError(f"Duplicate field: {duplicate}")
         self.schema.validate_config(config_dict)
-"""Configuration-related domain models"""
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union, Literal
-
-@dataclass(frozen=True)
-class ValidationRule:
-    """Defines validation rules for configuration values"""
-    rule_type: str  # e.g. "min", "max", "pattern", "choices", "range"
-    value: Any  # The validation constraint value
-    message: Optional[str] = None  # Custom error message
-
-@dataclass(frozen=True)
-class ConfigValue:
-    """A strongly-typed configuration value"""
-    name: str
-    value: Union[str, int, bool, float]  # Only primitive scalar types
-    description: Optional[str] = None
-
-@dataclass(frozen=True)
-class PropertyDefinition:
-    """Schema definition for a single configuration property"""
-    type: Literal["str", "int", "bool", "float"]  # Only allow specific primitive types
-    description: Optional[str] = None
-    default: Optional[Any] = None
-    required: bool = False
-    validation_rules: List[ValidationRule] = field(default_factory=list)
-
-@dataclass(frozen=True)
-class ProtocolConfigSchema:
-    """Schema definition for protocol configuration"""
-    properties: Dict[str, PropertyDefinition]  # Use PropertyDefinition instead of Dict[str, Any]
-    required: List[str]  # Required field names
-    description: Optional[str] = None
-    
-    def __post_init__(self):
-        # Validate that required fields exist in properties
-        missing = [field for field in self.required if field not in self.properties]
-        if missing:
-            raise ValueError(f"Required fields missing from properties: {', '.join(missing)}")
-        
-        # Validate property definitions
-        for field_name, field_def in self.properties.items():
-            if not isinstance(field_def, PropertyDefinition):
-                raise ValueError(f"Field {field_name} must use PropertyDefinition")
-
-    def validate_config(self, config: Dict[str, Any]) -> None:
-        """Validate a configuration against this schema"""
-        # Check required fields
-        missing = [field for field in self.required if field not in config]
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
-            
-        # Validate field types
-        for field_name, value in config.items():
-            if field_name not in self.properties:
-                raise ValueError(f"Unknown field: {field_name}")
-                
-            prop_def = self.properties[field_name]
-            expected_type = eval(prop_def.type)  # Safe since type is from Literal
-            if not isinstance(value, expected_type):
-                raise ValueError(f"Field {field_name} must be of type {prop_def.type}")
-            
-            # Apply validation rules if any
-            for rule in prop_def.validation_rules:
-                if not self._validate_rule(value, rule):
-                    raise ValueError(
-                        rule.message or f"Field {field_name} failed validation rule: {rule.rule_type}"
-                    )
-
-    def _validate_rule(self, value: Any, rule: ValidationRule) -> bool:
-        """Apply a validation rule to a value"""
-        if rule.rule_type == "min":
-            return value >= rule.value
-        elif rule.rule_type == "max":
-            return value <= rule.value
-        elif rule.rule_type == "pattern":
-            import re
-            return bool(re.match(rule.value, str(value)))
-        elif rule.rule_type == "choices":
-            return value in rule.value
-        elif rule.rule_type == "range":
-            min_val, max_val = rule.value
-            return min_val <= value <= max_val
-        return False  # Unknown rule type
-"""Configuration-related domain models"""
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union, Literal
-
-@dataclass(frozen=True)
-class ValidationRule:
-    """Defines validation rules for configuration values"""
-    rule_type: str  # e.g. "min", "max", "pattern", "choices", "range"
-    value: Any  # The validation constraint value
-    message: Optional[str] = None  # Custom error message
-
-@dataclass(frozen=True)
-class ConfigValue:
-    """A strongly-typed configuration value"""
-    name: str
-    value: Union[str, int, bool, float]  # Only primitive scalar types
-    description: Optional[str] = None
+        # Keep the validated name -> value view for lookups
+        object.__setattr__(self, '_as_dict', MappingProxyType(config_dict))
 
-@dataclass(frozen=True)
-class PropertyDefinition:
-    """Schema definition for a single configuration property"""
-    type: Literal["str", "int", "bool", "float"]  # Only allow specific primitive types
-    description: Optional[str] = None
-    default: Optional[Any] = None
-    required: bool = False
-    validation_rules: List[ValidationRule] = field(default_factory=list)
+    def as_dict(self) -> Mapping[str, Any]:
+        """Read-only name -> value view of the validated values"""
+        return self._as_dict
 
-@dataclass(frozen=True)
-class ProtocolConfigSchema:
-    """Schema definition for protocol configuration"""
-    properties: Dict[str, PropertyDefinition]  # Use PropertyDefinition instead of Dict[str, Any]
-    required: List[str]  # Required field names
-    description: Optional[str] = None
-    
-    def __post_init__(self):
-        # Validate that required fields exist in properties
-        missing = [field for field in self.required if field not in self.properties]
-        if missing:
-            raise ValueError(f"Required fields missing from properties: {', '.join(missing)}")
-        
-        # Validate property definitions
-        for field_name, field_def in self.properties.items():
-            if not isinstance(field_def, PropertyDefinition):
-                raise ValueError(f"Field {field_name} must use PropertyDefinition")
-
-    def validate_config(self, config: Dict[str, Any]) -> None:
-        """Validate a configuration against this schema"""
-        # Check required fields
-        missing = [field for field in self.required if field not in config]
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
-            
-        # Validate field types
-        for field_name, value in config.items():
-            if field_name not in self.properties:
-                raise ValueError(f"Unknown field: {field_name}")
-                
-            prop_def = self.properties[field_name]
-            expected_type = eval(prop_def.type)  # Safe since type is from Literal
-            if not isinstance(value, expected_type):
-                raise ValueError(f"Field {field_name} must be of type {prop_def.type}")
-            
-            # Apply validation rules if any
-            for rule in prop_def.validation_rules:
-                if not self._validate_rule(value, rule):
-                    raise ValueError(
-                        rule.message or f"Field {field_name} failed validation rule: {rule.rule_type}"
-                    )
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get a config value by name"""
+        return self._as_dict.get(name, default)
 
-    def _validate_rule(self, value: Any, rule: ValidationRule) -> bool:
-        """Apply a validation rule to a value"""
-        if rule.rule_type == "min":
-            return value >= rule.value
-        elif rule.rule_type == "max":
-            return value <= rule.value
-        elif rule.rule_type == "pattern":
-            import re
-            return bool(re.match(rule.value, str(value)))
-        elif rule.rule_type == "choices":
-            return value in rule.value
-        elif rule.rule_type == "range":
-            min_val, max_val = rule.value
-            return min_val <= value <= max_val
-        return False  # Unknown rule type
+__all__ = ['ConfigValue', 'ValidationRule', 'PropertyDefinition', 'ProtocolConfigSchema', 'ProtocolConfig']
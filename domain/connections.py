@@ -1,12 +1,13 @@
 """Connection-related domain models"""
-from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence
 from .protocols import Protocol
 from .config import ConfigValue
 from .metrics import Metric
+from .base import fast_frozen_dataclass, utc_now
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('id', 'name'))
 class ConnectionStatus:
     """Status of a connection to an external service"""
     id: str
@@ -15,14 +16,23 @@ class ConnectionStatus:
     can_retry: bool = True
     severity: int = 0  # 0=normal, 1=warning, 2=error
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     """Protocol-specific connection details and state"""
     id: str
     protocol: Protocol 
     status: ConnectionStatus
     config: List[ConfigValue]  # Protocol configuration with validation
-    metrics: List[Metric] = field(default_factory=list)  # Connection health/stats
+    metrics: Sequence[Metric] = ()  # Connection health/stats; assign a list to collect
     last_error: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: Optional[datetime] = None  # Defaults to construction time
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        # Read the clock once for both timestamps
+        if self.created_at is None or self.updated_at is None:
+            now = utc_now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
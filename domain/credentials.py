@@ -1,10 +1,11 @@
 """Credential-related domain models"""
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
+from datetime import datetime
 from typing import Dict, Optional, Literal
 from .protocols import Protocol
+from .base import fast_frozen_dataclass, private_slots, utc_now
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('key', 'type'))
 class Secret:
     """A single secret value with metadata"""
     key: str
@@ -12,25 +13,34 @@ class Secret:
     type: Literal["token", "password", "api_key", "private_key", "certificate"]
     description: Optional[str] = None
     expires_at: Optional[datetime] = None
+    _str: str = field(init=False, repr=False, compare=False)  # Private slot, set in __post_init__
+
+    def __post_init__(self):
+        object.__setattr__(self, '_str', f"Secret(key='{self.key}', type='{self.type}')")
 
     def __str__(self) -> str:
         """Prevent accidental secret exposure in logs/output"""
-        return f"Secret(key='{self.key}', type='{self.type}')"
+        return self._str
 
     def __repr__(self) -> str:
         """Prevent accidental secret exposure in logs/output"""
         return self.__str__()
 
-@dataclass(frozen=True)
+@private_slots
+@dataclass(frozen=True, slots=True)
 class SecretCollection:
     """A validated collection of secrets"""
     secrets: Dict[str, Secret]
-    
+    _str: str = field(init=False, repr=False, compare=False)  # Private slot, set in __post_init__
+
     def __post_init__(self):
         # Validate secret names match their keys
-        for key, secret in self.secrets.items():
-            if key != secret.key:
-                raise ValueError(f"Secret key mismatch: {key} != {secret.key}")
+        if not all(key == secret.key for key, secret in self.secrets.items()):
+            key, secret = next((k, s) for k, s in self.secrets.items() if k != s.key)
+            raise ValueError(f"Secret key mismatch: {key} != {secret.key}")
+        # Copy so the cached string cannot go stale through the caller's dict
+        object.__setattr__(self, 'secrets', dict(self.secrets))
+        object.__setattr__(self, '_str', f"SecretCollection(keys={list(self.secrets)})")
 
     def get_secret(self, key: str) -> Optional[Secret]:
         """Safely access a secret by key"""
@@ -38,17 +48,26 @@ class SecretCollection:
 
     def __str__(self) -> str:
         """Safe string representation"""
-        return f"SecretCollection(keys={list(self.secrets.keys())})"
+        return self._str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Credential:
     """Authentication details for external services"""
     id: str
     name: str
     protocol: Protocol
     secrets: SecretCollection
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: Optional[datetime] = None  # Defaults to construction time
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        # Read the clock once for both timestamps
+        if self.created_at is None or self.updated_at is None:
+            now = utc_now()
+            if self.created_at is None:
+                object.__setattr__(self, 'created_at', now)
+            if self.updated_at is None:
+                object.__setattr__(self, 'updated_at', now)
 
     def get_secret(self, key: str) -> Optional[Secret]:
         """Safely access a secret"""
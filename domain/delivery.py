@@ -1,10 +1,17 @@
 """Delivery semantics and related domain concepts"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Literal
 from .validation import ValidationRule
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+# DeliverySemantic flag bits, so policies check guarantees with one int AND
+REQUIRES_ACK = 1
+ALLOWS_RETRY = 2
+PRESERVES_ORDER = 4
+REQUIRES_DEDUP = 8
+
+@fast_frozen_dataclass(intern=('id', 'name'))
 class DeliverySemantic:
     """Definition of a delivery guarantee"""
     id: str  # Identifier like "at_most_once"
@@ -14,8 +21,22 @@ class DeliverySemantic:
     allows_retry: bool  # Whether retries are permitted
     preserves_order: bool  # Whether ordering must be maintained
     requires_dedup: bool  # Whether deduplication is required
+    _mask: int = field(init=False, repr=False, compare=False)  # Private slot, set in __post_init__
+
+    def __post_init__(self):
+        object.__setattr__(self, '_mask', (
+            REQUIRES_ACK * bool(self.requires_ack)
+            | ALLOWS_RETRY * bool(self.allows_retry)
+            | PRESERVES_ORDER * bool(self.preserves_order)
+            | REQUIRES_DEDUP * bool(self.requires_dedup)
+        ))
 
-@dataclass(frozen=True)
+    @property
+    def mask(self) -> int:
+        """Guarantees as a bitfield of the module-level flag constants"""
+        return self._mask
+
+@fast_frozen_dataclass
 class DeliveryPolicy:
     """Concrete delivery configuration"""
     semantic: DeliverySemantic
@@ -25,20 +46,21 @@ class DeliveryPolicy:
 
     def __post_init__(self):
         # Validate policy matches semantic constraints
-        if not self.semantic.allows_retry and self.max_retries != 0:
+        mask = self.semantic.mask
+        if not mask & ALLOWS_RETRY and self.max_retries != 0:
             raise ValueError(f"{self.semantic.name} delivery cannot have retries")
-            
-        if self.semantic.requires_dedup and not self.semantic.requires_ack:
+
+        if mask & (REQUIRES_DEDUP | REQUIRES_ACK) == REQUIRES_DEDUP:
             raise ValueError(f"{self.semantic.name} delivery requires acknowledgment")
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryPattern:
     """Defines how content should be delivered"""
     pattern_type: Literal["push", "pull", "batch", "stream"]
     config: Dict[str, Any]
     validation_rules: List[ValidationRule]
 
-@dataclass
+@dataclass(slots=True)
 class BatchConfig:
     """Configuration for batch delivery"""
     max_size: int
@@ -46,7 +68,7 @@ class BatchConfig:
     partial_delivery: bool
     ordering_required: bool
 
-@dataclass
+@dataclass(slots=True)
 class ResponseConfig:
     """Expected response configuration"""
     timeout: int
@@ -54,7 +76,7 @@ class ResponseConfig:
     success_conditions: List[ValidationRule]
     error_mapping: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryAttempt:
     """Record of a delivery attempt"""
     timestamp: datetime
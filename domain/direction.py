@@ -1,54 +1,32 @@
 """Direction-related domain models"""
-from dataclasses import dataclass
+from enum import StrEnum
 from typing import Literal
 
 ActionDirectionType = Literal["efferent", "afferent", "inbound", "outbound"]
 
-@dataclass(frozen=True)
-class ActionDirection:
+class ActionDirection(StrEnum):
     """Valid action directions"""
-    EFFERENT: ActionDirectionType = "efferent"
-    OUTBOUND: ActionDirectionType = "outbound"  # Alias for efferent
-    AFFERENT: ActionDirectionType = "afferent"
-    INBOUND: ActionDirectionType = "inbound"    # Alias for afferent
+    EFFERENT = "efferent"
+    OUTBOUND = "outbound"  # Alias for efferent
+    AFFERENT = "afferent"
+    INBOUND = "inbound"    # Alias for afferent
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate direction including aliases"""
-        return value in {cls.EFFERENT, cls.OUTBOUND, cls.AFFERENT, cls.INBOUND}
+        return value in _ALIAS_MAP
 
     @classmethod
     def normalize(cls, value: str) -> str:
         """Convert aliases to canonical values"""
-        if value in {cls.OUTBOUND, cls.EFFERENT}:
-            return cls.EFFERENT
-        elif value in {cls.INBOUND, cls.AFFERENT}:
-            return cls.AFFERENT
-        raise ValueError(f"Invalid direction: {value}")
-"""Direction-related domain models"""
-from dataclasses import dataclass
-from typing import Literal
-
-ActionDirectionType = Literal["efferent", "afferent", "inbound", "outbound"]
-
-@dataclass(frozen=True)
-class ActionDirection:
-    """Valid action directions"""
-    EFFERENT: ActionDirectionType = "efferent"
-    OUTBOUND: ActionDirectionType = "outbound"  # Alias for efferent
-    AFFERENT: ActionDirectionType = "afferent"
-    INBOUND: ActionDirectionType = "inbound"    # Alias for afferent
-
-    @classmethod
-    def is_valid(cls, value: str) -> bool:
-        """Validate direction including aliases"""
-        return value in {cls.EFFERENT, cls.OUTBOUND, cls.AFFERENT, cls.INBOUND}
-
-    @classmethod
-    def normalize(cls, value: str) -> str:
-        """Convert aliases to canonical values"""
-        if value in {cls.OUTBOUND, cls.EFFERENT}:
-            return cls.EFFERENT
-        elif value in {cls.INBOUND, cls.AFFERENT}:
-            return cls.AFFERENT
-        raise ValueError(f"Invalid direction: {value}")
+        try:
+            return _ALIAS_MAP[value]
+        except KeyError:
+            raise ValueError(f"Invalid direction: {value}") from None
+
+_ALIAS_MAP = {
+    "efferent": ActionDirection.EFFERENT,
+    "outbound": ActionDirection.EFFERENT,
+    "afferent": ActionDirection.AFFERENT,
+    "inbound": ActionDirection.AFFERENT,
+}
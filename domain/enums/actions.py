@@ -1,29 +1,31 @@
 """Action-related enumeration types"""
-from dataclasses import dataclass
+from enum import StrEnum
 from typing import Literal
 
 ActionPatternType = Literal["single", "stream", "batch"]
 ActionDirectionType = Literal["efferent", "afferent"]
 
-@dataclass(frozen=True)
-class ActionPattern:
+class ActionPattern(StrEnum):
     """Valid action patterns"""
-    SINGLE: ActionPatternType = "single"
-    STREAM: ActionPatternType = "stream"
-    BATCH: ActionPatternType = "batch"
+    SINGLE = "single"
+    STREAM = "stream"
+    BATCH = "batch"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate action pattern"""
-        return value in {cls.SINGLE, cls.STREAM, cls.BATCH}
+        return value in _ACTION_PATTERNS
 
-@dataclass(frozen=True)
-class ActionDirection:
+_ACTION_PATTERNS = frozenset(m.value for m in ActionPattern)
+
+class ActionDirection(StrEnum):
     """Valid action directions"""
-    EFFERENT: ActionDirectionType = "efferent"
-    AFFERENT: ActionDirectionType = "afferent"
+    EFFERENT = "efferent"
+    AFFERENT = "afferent"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate action direction"""
-        return value in {cls.EFFERENT, cls.AFFERENT}
+        return value in _ACTION_DIRECTIONS
+
+_ACTION_DIRECTIONS = frozenset(m.value for m in ActionDirection)
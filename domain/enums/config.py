@@ -1,18 +1,19 @@
 """Configuration-related enumeration types"""
-from dataclasses import dataclass
+from enum import StrEnum
 from typing import Literal
 
 PropertyType = Literal["str", "int", "bool", "float"]
 
-@dataclass(frozen=True)
-class PropertyTypes:
+class PropertyTypes(StrEnum):
     """Valid property types"""
-    STRING: PropertyType = "str"
-    INTEGER: PropertyType = "int"
-    BOOLEAN: PropertyType = "bool"
-    FLOAT: PropertyType = "float"
+    STRING = "str"
+    INTEGER = "int"
+    BOOLEAN = "bool"
+    FLOAT = "float"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate property type"""
-        return value in {cls.STRING, cls.INTEGER, cls.BOOLEAN, cls.FLOAT}
+        return value in _PROPERTY_TYPES
+
+_PROPERTY_TYPES = frozenset(m.value for m in PropertyTypes)
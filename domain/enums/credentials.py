@@ -1,20 +1,20 @@
 """Credential-related enumeration types"""
-from dataclasses import dataclass
+from enum import StrEnum
 from typing import Literal
 
 SecretType = Literal["token", "password", "api_key", "private_key", "certificate"]
 
-@dataclass(frozen=True)
-class SecretTypes:
+class SecretTypes(StrEnum):
     """Valid secret types"""
-    TOKEN: SecretType = "token"
-    PASSWORD: SecretType = "password"
-    API_KEY: SecretType = "api_key"
-    PRIVATE_KEY: SecretType = "private_key"
-    CERTIFICATE: SecretType = "certificate"
+    TOKEN = "token"
+    PASSWORD = "password"
+    API_KEY = "api_key"
+    PRIVATE_KEY = "private_key"
+    CERTIFICATE = "certificate"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate secret type"""
-        return value in {cls.TOKEN, cls.PASSWORD, cls.API_KEY, 
-                        cls.PRIVATE_KEY, cls.CERTIFICATE}
+        return value in _SECRET_TYPES
+
+_SECRET_TYPES = frozenset(m.value for m in SecretTypes)
@@ -1,18 +1,19 @@
 """Delivery-related enumeration types"""
-from dataclasses import dataclass
+from enum import StrEnum
 from typing import Literal
 
 DeliveryPatternType = Literal["push", "pull", "batch", "stream"]
 
-@dataclass(frozen=True)
-class DeliveryPatternTypes:
+class DeliveryPatternTypes(StrEnum):
     """Valid delivery pattern types"""
-    PUSH: DeliveryPatternType = "push"
-    PULL: DeliveryPatternType = "pull"
-    BATCH: DeliveryPatternType = "batch"
-    STREAM: DeliveryPatternType = "stream"
+    PUSH = "push"
+    PULL = "pull"
+    BATCH = "batch"
+    STREAM = "stream"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate delivery pattern type"""
-        return value in {cls.PUSH, cls.PULL, cls.BATCH, cls.STREAM}
+        return value in _DELIVERY_PATTERN_TYPES
+
+_DELIVERY_PATTERN_TYPES = frozenset(m.value for m in DeliveryPatternTypes)
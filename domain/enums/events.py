@@ -1,16 +1,17 @@
 """Event-related enumeration types"""
-from dataclasses import dataclass
+from enum import StrEnum
 from typing import Literal
 
 DirectionType = Literal["incoming", "outgoing"]
 
-@dataclass(frozen=True)
-class Direction:
+class Direction(StrEnum):
     """Message direction types"""
-    INCOMING: DirectionType = "incoming"
-    OUTGOING: DirectionType = "outgoing"
+    INCOMING = "incoming"
+    OUTGOING = "outgoing"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate direction type"""
-        return value in {cls.INCOMING, cls.OUTGOING}
+        return value in _DIRECTIONS
+
+_DIRECTIONS = frozenset(m.value for m in Direction)
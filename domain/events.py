@@ -1,10 +1,11 @@
 """Event-related domain models"""
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from typing import Any, List, Optional, Literal
+from datetime import datetime
+from typing import Any, Optional, Literal, Sequence
 from .metadata import MetadataField
+from .base import utc_now
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A message flowing through the system"""
     id: str
@@ -13,17 +14,18 @@ class Event:
     content: Any
     content_type: str
     status: str
-    metadata: List[MetadataField] = field(default_factory=list)
+    metadata: Sequence[MetadataField] = ()
     error: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=utc_now)
     processed_at: Optional[datetime] = None
 """Event-related domain models"""
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from typing import Any, List, Optional, Literal
+from datetime import datetime
+from typing import Any, Optional, Literal, Sequence
 from .metadata import MetadataField
+from .base import utc_now
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A message flowing through the system"""
     id: str
@@ -32,20 +34,21 @@ class Event:
     content: Any
     content_type: str
     status: str
-    metadata: List[MetadataField] = field(default_factory=list)
+    metadata: Sequence[MetadataField] = ()
     error: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=utc_now)
     processed_at: Optional[datetime] = None
 """Event-related domain models"""
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
 
 from .direction import ActionDirectionType
 from .metadata import MetadataField
+from .base import utc_now
 from .metrics import Metric
 
-@dataclass
+@dataclass(slots=True)
 class Webhook:
     """Represents a configured webhook endpoint"""
     id: str
@@ -53,15 +56,15 @@ class Webhook:
     config: Dict[str, Any]
     enabled: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class EventStatus:
     """Status of a webhook event"""
     state: str  # e.g. "pending", "completed", "failed"
     correlation_id: Optional[str] = None
     error: Optional[str] = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = field(default_factory=utc_now)
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Message flowing through the system"""
     id: str
@@ -69,26 +72,27 @@ class Event:
     direction: ActionDirectionType
     content: Any
     content_type: str
-    metadata: List[MetadataField] = field(default_factory=list)
-    metrics: List[Metric] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    metadata: Sequence[MetadataField] = ()
+    metrics: Sequence[Metric] = ()
+    created_at: datetime = field(default_factory=utc_now)
     # Webhook-specific fields
     webhook_key: Optional[str] = None
     correlation_id: Optional[str] = None
     state: Optional[str] = None  # For webhook status tracking
 
-@dataclass
+@dataclass(slots=True)
 class WebhookResult:
     """Result of webhook processing"""
     result: Dict[str, str]  # The processed result data as string key-value pairs
     error: Optional[str] = None  # Any error message
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = field(default_factory=utc_now)
 """Event domain models"""
 from dataclasses import dataclass
 from datetime import datetime
+import sys
 from typing import Optional, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base event model"""
     id: str
@@ -96,7 +100,12 @@ class Event:
     event_type: str
     metadata: Dict[str, Any]
 
-@dataclass 
+    def __post_init__(self):
+        # Event types repeat across a stream; interned copies compare by identity
+        if self.event_type.__class__ is str:
+            self.event_type = sys.intern(self.event_type)
+
+@dataclass(slots=True)
 class WebhookKey:
     """Webhook authentication key"""
     key_id: str
@@ -106,7 +115,7 @@ class WebhookKey:
     used_at: Optional[datetime] = None
     response_id: Optional[str] = None  # Links to the webhook response that used this key
 
-@dataclass
+@dataclass(slots=True)
 class WebhookEvent(Event):
     """Webhook received event"""
     webhook_id: str
@@ -1,18 +1,32 @@
 """Domain models for inbound message handling"""
-from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+import json
+from typing import Dict, Optional, Any, Tuple, Union
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass
 class InboundMessageRequest:
     """External system sending data to Action Service"""
     endpoint: str
-    payload: Dict[str, Any]
+    payload: Union[bytes, Dict[str, Any]]  # Raw JSON bytes are passed through undecoded
     api_key: Optional[str] = None
     correlation_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    _decoded: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass(frozen=True)
+    def payload_dict(self) -> Dict[str, Any]:
+        """The payload as a dict, decoding raw JSON bytes on first use"""
+        payload = self.payload
+        if not isinstance(payload, bytes):
+            return payload
+        decoded = self._decoded
+        if decoded is None:
+            decoded = json.loads(payload)
+            object.__setattr__(self, '_decoded', decoded)
+        return decoded
+
+@fast_frozen_dataclass(intern=('validation_status',))
 class InboundMessageResponse:
     """Acknowledgment to external system"""
     message_id: str
@@ -21,7 +35,7 @@ class InboundMessageResponse:
     validation_details: Optional[Dict[str, Any]] = None
     correlation_id: Optional[str] = None
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('protocol_id',))
 class WorkerProcessingRequest:
     """Validated message ready for processing"""
     message_id: str
@@ -30,7 +44,7 @@ class WorkerProcessingRequest:
     metadata: Dict[str, Any]
     correlation_id: Optional[str] = None
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('status',))
 class WorkerProcessingResponse:
     """Processing outcome"""
     message_id: str
@@ -38,42 +52,50 @@ class WorkerProcessingResponse:
     status: str  # "processed", "failed", "deferred"
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    next_actions: List[str] = None
+    next_actions: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        if not isinstance(self.next_actions, tuple):
+            object.__setattr__(self, 'next_actions', tuple(self.next_actions or ()))
 """Message-related domain models"""
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
+from datetime import datetime
+from enum import StrEnum
+import sys
 from typing import Dict, Optional, Any, List, Literal
 from .direction import ActionDirection, ActionDirectionType
+from .base import utc_now
 
 # Define literal types
 MessageLevelType = Literal["error", "warning", "info"]
 MessageTargetType = Literal["global", "action", "protocol"]
 
-@dataclass(frozen=True)
-class MessageLevel:
+class MessageLevel(StrEnum):
     """Valid message severity levels"""
-    ERROR: MessageLevelType = "error"
-    WARNING: MessageLevelType = "warning"
-    INFO: MessageLevelType = "info"
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate message level"""
-        return value in {cls.ERROR, cls.WARNING, cls.INFO}
+        return value in _MESSAGE_LEVELS
 
-@dataclass(frozen=True)
-class MessageTarget:
+class MessageTarget(StrEnum):
     """Message targeting types"""
-    GLOBAL: MessageTargetType = "global"
-    ACTION: MessageTargetType = "action"
-    PROTOCOL: MessageTargetType = "protocol"
+    GLOBAL = "global"
+    ACTION = "action"
+    PROTOCOL = "protocol"
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Validate message target"""
-        return value in {cls.GLOBAL, cls.ACTION, cls.PROTOCOL}
+        return value in _MESSAGE_TARGETS
+
+_MESSAGE_LEVELS = frozenset(m.value for m in MessageLevel)
+_MESSAGE_TARGETS = frozenset(m.value for m in MessageTarget)
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """System message/notification"""
     id: str
@@ -89,14 +111,21 @@ class Message:
     acknowledgment_notes: Optional[str] = None
     expires_at: Optional[datetime] = None
     direction: Optional[ActionDirectionType] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=utc_now)
 
     def __post_init__(self):
         """Validate enum fields"""
+        # Levels and targets repeat across many messages; share one copy of each
+        if self.level.__class__ is str:
+            self.level = sys.intern(self.level)
+        if self.target_type.__class__ is str:
+            self.target_type = sys.intern(self.target_type)
+        # Common case: valid level, no direction or target type
+        if self.level in _MESSAGE_LEVELS and not self.direction and self.target_type is None:
+            return
         if self.direction and not ActionDirection.is_valid(self.direction):
             raise ValueError(f"Invalid direction: {self.direction}")
-        if not MessageLevel.is_valid(self.level):
+        if self.level not in _MESSAGE_LEVELS:
             raise ValueError(f"Invalid message level: {self.level}")
-        
-        if self.target_type is not None and not MessageTarget.is_valid(self.target_type):
+        if self.target_type is not None and self.target_type not in _MESSAGE_TARGETS:
             raise ValueError(f"Invalid target type: {self.target_type}")
@@ -1,18 +1,12 @@
 """Metadata-related domain models"""
-from dataclasses import dataclass
-from typing import Any, Optional, Union
+from typing import Any, Optional
+from .base import fast_frozen_dataclass
+from .metrics import Metric
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('name', 'category'))
 class MetadataField:
     """A strongly-typed metadata field with context"""
     name: str
     value: Any
     category: str  # e.g. "system", "user", "audit"
     description: Optional[str] = None
-
-@dataclass(frozen=True)
-class Metric:
-    """A single named value with optional description"""
-    name: str
-    value: Union[str, int, float, bool]
-    description: Optional[str] = None
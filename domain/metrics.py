@@ -1,8 +1,8 @@
 """Metric-related domain models"""
-from dataclasses import dataclass
 from typing import Union, Optional
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('name',))
 class Metric:
     """A single named value with optional description"""
     name: str
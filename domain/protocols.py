@@ -1,9 +1,9 @@
 """Protocol-related domain models"""
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 from .delivery import DeliverySemantic, DeliveryPolicy
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('id', 'name', 'category'))
 class Protocol:
     """Supported protocols for actions"""
     id: str
@@ -11,10 +11,15 @@ class Protocol:
     description: str
     category: str
     handler_class: str  # Full path to handler class
-    supported_semantics: List[DeliverySemantic]  # Delivery guarantees this protocol can provide
+    supported_semantics: Tuple[DeliverySemantic, ...]  # Delivery guarantees this protocol can provide
     default_policy: DeliveryPolicy  # Default delivery configuration
 
-@dataclass(frozen=True)
+    def __post_init__(self):
+        # Tuple storage keeps protocols hashable for use as dict keys and set members
+        if not isinstance(self.supported_semantics, tuple):
+            object.__setattr__(self, 'supported_semantics', tuple(self.supported_semantics))
+
+@fast_frozen_dataclass(intern=('id', 'name', 'category'))
 class ActionType:
     """Categories of actions the service can perform"""
     id: str
@@ -1,16 +1,29 @@
 """Publisher-related domain models"""
-from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from .routing import RoutingConfiguration
-from .templates import TransformRule
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+from .base import utc_now
 
-@dataclass
+if TYPE_CHECKING:
+    from .routing import RoutingConfiguration
+    from .templates import TransformRule
+
+@dataclass(slots=True)
 class Publisher:
     """Continuous outbound data feed configuration"""
     id: str
     action_id: str
     connection_id: str
-    routing: RoutingConfiguration  # Complete routing strategy
-    transform: TransformRule      # Single transform rule
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    routing: 'RoutingConfiguration'  # Complete routing strategy
+    transform: 'TransformRule'      # Single transform rule
+    created_at: Optional[datetime] = None  # Defaults to construction time
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        # Read the clock once for both timestamps
+        if self.created_at is None or self.updated_at is None:
+            now = utc_now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
@@ -1,8 +1,9 @@
 """Routing-related domain models"""
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Literal
+from dataclasses import field
+from typing import Dict, Optional, Any, Literal, Tuple
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('name', 'destination'))
 class RoutingRule:
     """Single rule for determining message destination"""
     name: str
@@ -11,11 +12,44 @@ class RoutingRule:
     priority: int = 0  # Higher priority routes are tried first
     config: Dict[str, Any] = field(default_factory=dict)  # Additional routing config
     description: Optional[str] = None
+    _condition_path: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
 
-@dataclass(frozen=True)
+    def __post_init__(self):
+        # Split the dot-notation condition once rather than per message
+        if self.condition:
+            object.__setattr__(self, '_condition_path', tuple(self.condition.split('.')))
+
+    def matches(self, message: Dict[str, Any]) -> bool:
+        """Whether the value at the condition path of a message is truthy"""
+        if not self.condition:
+            return True
+        value = message
+        try:
+            for part in self._condition_path:
+                value = value[part]
+        except (KeyError, IndexError, TypeError):
+            return False
+        return bool(value)
+
+@fast_frozen_dataclass(intern=('strategy',))
 class RoutingConfiguration:
     """Complete routing strategy for a publisher"""
-    rules: List[RoutingRule]
+    rules: Tuple[RoutingRule, ...]
     strategy: Literal["first-match", "all-matching", "priority"] = "first-match"
     fallback: Optional[RoutingRule] = None
     description: Optional[str] = None
+
+    _by_priority: Tuple[RoutingRule, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.rules, tuple):
+            object.__setattr__(self, 'rules', tuple(self.rules))
+        # Highest priority first; equal priorities keep their declared order
+        object.__setattr__(
+            self, '_by_priority', tuple(sorted(self.rules, key=lambda r: r.priority, reverse=True))
+        )
+
+    @property
+    def rules_by_priority(self) -> Tuple[RoutingRule, ...]:
+        """Rules sorted once at construction, highest priority first"""
+        return self._by_priority
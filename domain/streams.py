@@ -1,10 +1,9 @@
 """Stream-related domain models"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Optional
 from .direction import ActionDirection, ActionDirectionType
-from .direction import ActionDirection, ActionDirectionType
 
-@dataclass
+@dataclass(slots=True)
 class AfferentStream:
     """Incoming data stream configuration"""
     id: str
@@ -12,12 +11,9 @@ class AfferentStream:
     config: Dict
     status: str = "inactive"
     description: Optional[str] = None
+    direction: ActionDirectionType = field(default=ActionDirection.AFFERENT, init=False)  # Implicitly inbound-only
 
-    def __post_init__(self):
-        """Implicitly inbound-only"""
-        object.__setattr__(self, 'direction', ActionDirection.AFFERENT)
-
-@dataclass 
+@dataclass(slots=True)
 class EfferentStream:
     """Outgoing data stream configuration"""
     id: str
@@ -26,7 +22,7 @@ class EfferentStream:
     status: str = "inactive"
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class StreamMonitor:
     """Stream health monitoring data"""
     stream_id: str
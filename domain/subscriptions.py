@@ -1,34 +1,31 @@
 """Subscription and Publisher domain models"""
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
-from .templates import TransformRule
-from .routing import RoutingConfiguration
-from .direction import ActionDirection, ActionDirectionType
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+from .base import utc_now
 from .direction import ActionDirection, ActionDirectionType
+from .publishers import Publisher  # Re-exported from its canonical module
+
+if TYPE_CHECKING:
+    from .templates import TransformRule
 
-@dataclass
+@dataclass(slots=True)
 class Subscription:
     """Continuous inbound data feed configuration"""
     id: str
     action_id: str
     connection_id: str
-    filters: TransformRule   # What data to receive
-    transform: TransformRule # How to process it
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    filters: 'TransformRule'   # What data to receive
+    transform: 'TransformRule' # How to process it
+    created_at: Optional[datetime] = None  # Defaults to construction time
+    updated_at: Optional[datetime] = None
+    direction: ActionDirectionType = field(default=ActionDirection.AFFERENT, init=False)  # Implicitly inbound-only
 
     def __post_init__(self):
-        """Implicitly inbound-only"""
-        object.__setattr__(self, 'direction', ActionDirection.AFFERENT)
-
-@dataclass
-class Publisher:
-    """Continuous outbound data feed configuration"""
-    id: str
-    action_id: str
-    connection_id: str
-    routing: RoutingConfiguration  # Complete routing strategy
-    transform: TransformRule      # Single transform rule
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-
+        # Read the clock once for both timestamps
+        if self.created_at is None or self.updated_at is None:
+            now = utc_now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
@@ -1,8 +1,8 @@
 """Template-related domain models"""
-from dataclasses import dataclass
 from typing import Dict, Any, Optional
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('name', 'transform_type'))
 class TransformRule:
     """A data transformation rule"""
     name: str
@@ -10,7 +10,7 @@ class TransformRule:
     config: Dict[str, Any]
     description: Optional[str] = None
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(intern=('content_type',))
 class ActionTemplate:
     """Template for transforming action data"""
     content: str  # Jinja2 template content
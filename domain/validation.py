@@ -1,8 +1,11 @@
 """Validation rules and related domain concepts"""
-from dataclasses import dataclass
-from typing import Any, Optional, List, Literal
+from typing import Any, Optional, Literal, Tuple
+from .base import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+_RULE_TYPES = ("required", "type", "pattern", "range", "choices", "custom")
+_VALID_RULE_TYPES = frozenset(_RULE_TYPES)
+
+@fast_frozen_dataclass(intern=('rule_type',))
 class ValidationRule:
     """Definition of a validation rule"""
     rule_type: Literal["required", "type", "pattern", "range", "choices", "custom"]
@@ -11,18 +14,17 @@ class ValidationRule:
     
     def __post_init__(self):
         # Validate rule_type is one of the allowed literals
-        valid_types = ["required", "type", "pattern", "range", "choices", "custom"]
-        if self.rule_type not in valid_types:
-            raise ValueError(f"Invalid rule_type. Must be one of: {valid_types}")
+        if self.rule_type not in _VALID_RULE_TYPES:
+            raise ValueError(f"Invalid rule_type. Must be one of: {list(_RULE_TYPES)}")
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass
 class ValidationResult:
     """Result of applying validation rules"""
     success: bool
-    errors: List[str] = None
+    errors: Tuple[str, ...] = ()
     field_name: Optional[str] = None
     rule: Optional[ValidationRule] = None
 
     def __post_init__(self):
-        # Initialize empty list if None
-        object.__setattr__(self, 'errors', self.errors or [])
+        if not isinstance(self.errors, tuple):
+            object.__setattr__(self, 'errors', tuple(self.errors or ()))
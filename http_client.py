@@ -0,0 +1,22 @@
+"""Shared HTTP client for outbound protocol and plugin calls"""
+import atexit
+import threading
+from typing import Optional
+
+import httpx
+
+# One pooled client per process, so repeated calls reuse keep-alive connections
+_CLIENT: Optional[httpx.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+def get_http_client() -> httpx.Client:
+    """The shared client, created on first use and closed at interpreter exit"""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
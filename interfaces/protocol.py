@@ -12,8 +12,14 @@ class ProtocolConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")  # Prevent unknown fields
 
 class ProtocolHandler(ABC):
-    """Base class for all protocol implementations"""
-    
+    """Base class for all protocol implementations
+
+    Handlers are created per execution, so the base declares ``__slots__``;
+    subclasses should declare their own (``__slots__ = ()`` if they add no
+    attributes) or they get a per-instance ``__dict__`` back.
+    """
+    __slots__ = ('config', 'last_error')
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.last_error: Optional[str] = None
@@ -5,13 +5,45 @@ This module defines the data structures for incoming API requests,
 using Pydantic models to ensure validation and type safety.
 """
 
-from typing import Dict, Optional, Any, Literal, Union, List, get_args
+from typing import Annotated, Dict, Optional, Any, Literal, Union, List
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing_extensions import TypedDict
+from pydantic import BaseModel, Field, ConfigDict, StrictBool, StrictFloat, StrictInt, field_validator
+
+from ..domain.messages import MessageLevel, MessageTarget
+
+# Shared model configs; pydantic copies these at class creation
+_STRICT = ConfigDict(extra="forbid")
+_STRICT_FROZEN = ConfigDict(extra="forbid", frozen=True)
+
+class _ConfigModel(BaseModel):
+    """Base for typed config blocks that still support dict-style reads"""
+    model_config = _STRICT_FROZEN
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.model_fields_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.model_fields_set
+
+class BatchConfig(_ConfigModel):
+    """Batch delivery configuration"""
+    size: Optional[int] = Field(None, ge=1, description="Maximum items per batch")
+    window: Optional[str] = Field(None, description="Batching window, e.g. '1h'")
+    partial_delivery: Optional[bool] = Field(None, description="Whether partial batches may be delivered")
+    ordering_required: Optional[bool] = Field(None, description="Whether batch order must be preserved")
+
+class ResponseConfig(_ConfigModel):
+    """Response handling configuration"""
+    target_endpoint: Optional[str] = Field(None, description="Where responses are pushed")
+    timeout: Optional[int] = Field(None, ge=0, description="Response timeout in seconds")
+    required_fields: Optional[List[str]] = Field(None, description="Fields the response must contain")
 
 class ExecuteActionRequest(BaseModel):
     """Request to execute an action on behalf of Julee"""
-    model_config = ConfigDict(extra="forbid")  # Be strict!
+    model_config = _STRICT  # Be strict!
     
     action_id: str = Field(..., description="ID of the pre-configured action to execute")
     content: Union[Dict[str, Any], List[Dict[str, Any]]] = Field(..., description="Content to be delivered (single item or batch)")
@@ -20,13 +52,13 @@ class ExecuteActionRequest(BaseModel):
     deadline: Optional[datetime] = Field(None, description="When this must complete by")
     idempotency_key: Optional[str] = Field(None, description="Client-provided deduplication key")
     delivery_pattern: Optional[str] = Field(None, description="Delivery pattern to use")
-    batch_config: Optional[Dict] = Field(None, description="Batch delivery configuration")
-    response_config: Optional[Dict] = Field(None, description="Response handling configuration")
+    batch_config: Optional[BatchConfig] = Field(None, description="Batch delivery configuration")
+    response_config: Optional[ResponseConfig] = Field(None, description="Response handling configuration")
     ordering_key: Optional[str] = Field(None, description="Key for ordered delivery")
 
 class ActionAcceptedResponse(BaseModel):
     """Immediate response confirming action acceptance"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     request_id: str = Field(..., description="Server-assigned request tracking ID")
     status: Literal["accepted"] = "accepted"
@@ -34,7 +66,7 @@ class ActionAcceptedResponse(BaseModel):
 
 class ActionStatusResponse(BaseModel):
     """Status check response"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     request_id: str = Field(..., description="Server-assigned request tracking ID") 
     correlation_id: str = Field(..., description="Client's correlation ID")
@@ -49,7 +81,7 @@ class ActionStatusResponse(BaseModel):
 
 class WebhookRequest(BaseModel):
     """Incoming webhook request"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     payload: Optional[Dict[str, Any]] = Field(None, description="JSON payload")
     raw_data: Optional[bytes] = Field(None, description="Raw binary data")
@@ -67,38 +99,35 @@ class WebhookRequest(BaseModel):
 
 class WebhookStatusRequest(BaseModel):
     """Request to check webhook processing status"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     response_id: str = Field(..., description="Response ID from webhook submission")
 
+class CallbackPayload(TypedDict, total=False):
+    """Callback payload; arbitrary keys with a bounded optional confidence"""
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    confidence: Annotated[Union[StrictBool, StrictInt, StrictFloat], Field(ge=0, le=1)]
+
 class ActionCallbackRequest(BaseModel):
     """Internal callback request from trusted sources"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     protocol_id: str = Field(..., description="Protocol identifier")
     action_type_id: str = Field(..., description="Action type identifier")
-    payload: Dict[str, Any] = Field(..., description="Callback payload")
+    payload: CallbackPayload = Field(..., description="Callback payload")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Optional metadata")
 
-    @field_validator('payload')
-    def validate_confidence(cls, v):
-        """Validate confidence is between 0 and 1"""
-        if 'confidence' in v:
-            confidence = v['confidence']
-            if not isinstance(confidence, (int, float)) or confidence < 0 or confidence > 1:
-                raise ValueError("Confidence must be a number between 0 and 1")
-        return v
-
 class ProcessActionRequest(BaseModel):
     """Internal request to process an action"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     action_id: str = Field(..., description="Action identifier")
     retry_count: int = Field(0, description="Number of retry attempts")
 
 class CreateActionRequest(BaseModel):
     """Request to create a new action definition"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     name: str = Field(..., description="Name of the action")
     description: str = Field(..., description="Description of the action")
@@ -112,7 +141,7 @@ class CreateActionRequest(BaseModel):
 
 class ListActionsRequest(BaseModel):
     """Request to list actions with filters"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     action_type: Optional[str] = Field(None, description="Filter by action type")
     protocol: Optional[str] = Field(None, description="Filter by protocol")
@@ -121,7 +150,7 @@ class ListActionsRequest(BaseModel):
 
 class ListEventsRequest(BaseModel):
     """Request to list events with filters"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     action_id: Optional[str] = Field(None, description="Filter by action")
     status: Optional[str] = Field(None, description="Filter by status")
@@ -130,15 +159,16 @@ class ListEventsRequest(BaseModel):
     page: int = Field(1, ge=1, description="Page number")
     page_size: int = Field(50, ge=1, le=100, description="Items per page")
 
-MessageLevelType = Literal["error", "warning", "info"]
-MessageTargetType = Literal["global", "action", "protocol"]
+# Shared enum validators rather than a literal validator per request model
+MessageLevelType = MessageLevel
+MessageTargetType = MessageTarget
 
 class CreateSystemMessageRequest(BaseModel):
     """Request model for system message creation"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
-    title: str = Field(..., description="Message title/summary")
-    content: str = Field(..., description="Full message content")
+    title: str = Field(..., max_length=200, description="Message title/summary")
+    content: str = Field(..., max_length=5000, description="Full message content")
     level: MessageLevelType = Field(..., description="Message severity level")
     source: str = Field(..., description="System component that generated message")
     target_type: Optional[MessageTargetType] = Field(None, description="Type of target this message is for")
@@ -146,18 +176,6 @@ class CreateSystemMessageRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional message metadata")
     expires_at: Optional[datetime] = Field(None, description="When this message should expire")
     
-    @field_validator('title')
-    def validate_title_length(cls, v):
-        if len(v) > 200:
-            raise ValueError("Title must be 200 characters or less")
-        return v
-    
-    @field_validator('content')
-    def validate_content_length(cls, v):
-        if len(v) > 5000:
-            raise ValueError("Content must be 5000 characters or less")
-        return v
-    
     @field_validator('target_id')
     def validate_target_id(cls, v, values):
         if v and not values.data.get('target_type'):
@@ -166,7 +184,7 @@ class CreateSystemMessageRequest(BaseModel):
 
 class CreateCredentialRequest(BaseModel):
     """Request to store new credentials"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     name: str = Field(..., description="Name for the credentials")
     protocol: str = Field(..., description="Protocol identifier")
@@ -175,30 +193,18 @@ class CreateCredentialRequest(BaseModel):
 
 class UpdateMessageRequest(BaseModel):
     """Request model for updating system message"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     message_id: str = Field(..., description="ID of message to update")
-    title: Optional[str] = Field(None, description="New message title")
-    content: Optional[str] = Field(None, description="New message content")
+    title: Optional[str] = Field(None, max_length=200, description="New message title")
+    content: Optional[str] = Field(None, max_length=5000, description="New message content")
     level: Optional[MessageLevelType] = Field(None, description="New message severity level")
     expires_at: Optional[datetime] = Field(None, description="New expiration time")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Updated metadata")
-    
-    @field_validator('title')
-    def validate_title_length(cls, v):
-        if v and len(v) > 200:
-            raise ValueError("Title must be 200 characters or less")
-        return v
-    
-    @field_validator('content') 
-    def validate_content_length(cls, v):
-        if v and len(v) > 5000:
-            raise ValueError("Content must be 5000 characters or less")
-        return v
 
 class CreateStreamRequest(BaseModel):
     """Request model for creating a new stream."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     name: str = Field(..., description="Name of the stream")
     type: str = Field(..., description="Stream type (afferent/efferent)")
@@ -207,14 +213,14 @@ class CreateStreamRequest(BaseModel):
 
 class UpdateStreamStatusRequest(BaseModel):
     """Request model for updating stream status."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     status: str = Field(..., description="New status value")
 
 
 class CreateTemplateRequest(BaseModel):
     """Request model for creating an action template."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     name: str = Field(..., description="Template name")
     description: str = Field(..., description="Template description")
@@ -224,7 +230,7 @@ class CreateTemplateRequest(BaseModel):
 
 class UpdateTemplateRequest(BaseModel):
     """Request model for updating an action template."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     name: Optional[str] = Field(None, description="New template name")
     description: Optional[str] = Field(None, description="New description")
@@ -233,14 +239,14 @@ class UpdateTemplateRequest(BaseModel):
 
 class UpdateMonitorMetricsRequest(BaseModel):
     """Request model for updating stream metrics."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     metrics: Dict = Field(..., description="New metrics data")
 
 
 class UpdateMonitorStatusRequest(BaseModel):
     """Request model for updating monitor status."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT
     
     status: str = Field(..., description="New status")
     error_count: int = Field(..., description="Current error count")
@@ -5,25 +5,30 @@ This module defines the data structures for API responses,
 using Pydantic models to ensure consistent output formatting.
 """
 
-from typing import Dict, List, Optional, Union, Any, Literal
+from typing import Dict, List, Optional, Any, Literal
 from datetime import datetime, UTC
 from pydantic import BaseModel, Field, ConfigDict
 
+from ..domain import ActionTemplate
+
+# Shared model configs; pydantic copies these at class creation
+_STRICT_FROZEN = ConfigDict(extra="forbid", frozen=True)
+
 class RateLimitInfo(BaseModel):
     """Rate limit information included in responses"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     limit: int = Field(..., description="Rate limit ceiling")
     remaining: int = Field(..., description="Remaining requests")
     reset: datetime = Field(..., description="When limit resets")
-from datetime import datetime, UTC
-from pydantic import BaseModel, Field, ConfigDict
 
-from ..domain import ActionTemplate
+def _utc_now() -> datetime:
+    """Default factory for response timestamps"""
+    return datetime.now(UTC)
 
 class ActionStatusResponse(BaseModel):
     """Status check response"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     request_id: str = Field(..., description="Server-assigned request tracking ID") 
     correlation_id: str = Field(..., description="Client's correlation ID")
@@ -34,7 +39,7 @@ class ActionStatusResponse(BaseModel):
 
 class StreamResponse(BaseModel):
     """Base response model for stream operations."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     action: Dict = Field(..., description="Action details")
     status: str = Field(..., description="Operation status")
@@ -42,14 +47,14 @@ class StreamResponse(BaseModel):
 
 class StreamListResponse(BaseModel):
     """Response model for listing streams."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     actions: List[Dict] = Field(..., description="List of stream actions")
     total: int = Field(..., description="Total number of streams")
 
 class TemplateResponse(BaseModel):
     """Response model for template operations."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     template: ActionTemplate = Field(..., description="Template details")
     status: str = Field(..., description="Operation status")
@@ -57,30 +62,22 @@ class TemplateResponse(BaseModel):
 
 class TemplateListResponse(BaseModel):
     """Response model for listing templates."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     templates: List[ActionTemplate] = Field(..., description="List of templates")
     total: int = Field(..., description="Total number of templates")
 
 class MonitorResponse(BaseModel):
     """Response model for monitor operations."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     metrics: Dict = Field(..., description="Monitoring metrics")
     status: str = Field(..., description="Operation status")
     message: Optional[str] = Field(None, description="Additional information")
 
-class WebhookAcceptedResponse(BaseModel):
-    """Response to webhook submission"""
-    model_config = ConfigDict(extra="forbid")
-    
-    response_id: str = Field(..., description="Unique response ID for status checking")
-    status: Literal["accepted"] = "accepted"
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
-
 class WebhookStatusResponse(BaseModel):
     """Response to status check"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     response_id: str = Field(..., description="Response ID being checked")
     status: Literal["pending", "processing", "completed", "failed"] = Field(..., description="Current status")
@@ -88,51 +85,51 @@ class WebhookStatusResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
     error_details: Optional[Dict[str, Any]] = Field(None, description="Detailed error information")
     correlation_id: Optional[str] = Field(None, description="Client correlation ID")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=_utc_now)
     rate_limit: Optional[RateLimitInfo] = Field(None, description="Rate limit details")
 
 class WebhookAcceptedResponse(BaseModel):
     """Response to webhook submission"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     response_id: str = Field(..., description="Response ID for status checking")
     status: Literal["accepted"] = "accepted"
     correlation_id: Optional[str] = Field(None, description="Client correlation ID")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=_utc_now)
     rate_limit: Optional[RateLimitInfo] = Field(None, description="Rate limit details")
 
 class WebhookErrorResponse(BaseModel):
     """Standard error response for webhook API"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     error: str = Field(..., description="Error code")
     message: str = Field(..., description="Human readable error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error context")
     correlation_id: Optional[str] = Field(None, description="Client correlation ID")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=_utc_now)
     rate_limit: Optional[RateLimitInfo] = Field(None, description="Rate limit details")
 
 class CallbackAcceptedResponse(BaseModel):
     """Response to internal callback submission"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     callback_id: str = Field(..., description="Callback identifier")
     status: Literal["accepted"] = "accepted"
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=_utc_now)
 
 class ActionResponse(BaseModel):
     """Response for action operations"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     action_id: str = Field(..., description="Action identifier")
     name: str = Field(..., description="Action name")
     status: str = Field(..., description="Operation status")
     message: Optional[str] = Field(None, description="Optional status message")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=_utc_now)
 
 class ActionListResponse(BaseModel):
     """Response for action listing"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     actions: List[Dict[str, Any]] = Field(..., description="List of actions")
     total: int = Field(..., description="Total number of actions")
@@ -142,7 +139,7 @@ class ActionListResponse(BaseModel):
 
 class EventListResponse(BaseModel):
     """Response for event listing"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     events: List[Dict[str, Any]] = Field(..., description="List of events")
     total: int = Field(..., description="Total number of events")
@@ -152,7 +149,7 @@ class EventListResponse(BaseModel):
 
 class CredentialResponse(BaseModel):
     """Response for credential operations"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     credential_id: str = Field(..., description="Credential identifier")
     name: str = Field(..., description="Credential name")
@@ -162,7 +159,7 @@ class CredentialResponse(BaseModel):
 
 class CredentialListResponse(BaseModel):
     """Response for credential listing"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = _STRICT_FROZEN
     
     credentials: List[Dict[str, Any]] = Field(..., description="List of credentials")
     total: int = Field(..., description="Total number of credentials")
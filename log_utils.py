@@ -1,19 +1,25 @@
 """Centralized logging for Action Service"""
 import logging
 from typing import Optional
-from functools import wraps
+from functools import lru_cache, wraps
 import time
 import asyncio
 
 class ActionServiceLogger:
     """Centralized logging for Action Service"""
+
+    # Logger names that already have their console handler attached
+    _initialized: set = set()
     
     def __init__(self, debug_mode: bool = False):
         self.logger = logging.getLogger("action_service")
         level = logging.DEBUG if debug_mode else logging.INFO
         self.logger.setLevel(level)
         
-        # Add console handler if none exists
+        # Add console handler once per logger name
+        if self.logger.name in self._initialized:
+            return
+        self._initialized.add(self.logger.name)
         if not self.logger.handlers:
             handler = logging.StreamHandler()
             formatter = logging.Formatter(
@@ -25,48 +31,63 @@ class ActionServiceLogger:
     def debug(self, message: str, correlation_id: Optional[str] = None):
         """Log debug message with optional correlation ID"""
         if correlation_id:
-            message = f"[{correlation_id}] {message}"
-        self.logger.debug(message)
+            self.logger.debug("[%s] %s", correlation_id, message)
+        else:
+            self.logger.debug(message)
 
     def info(self, message: str, correlation_id: Optional[str] = None):
         """Log info message with optional correlation ID"""
         if correlation_id:
-            message = f"[{correlation_id}] {message}"
-        self.logger.info(message)
+            self.logger.info("[%s] %s", correlation_id, message)
+        else:
+            self.logger.info(message)
 
     def error(self, message: str, correlation_id: Optional[str] = None, exc_info=None):
         """Log error message with optional correlation ID and exception info"""
         if correlation_id:
-            message = f"[{correlation_id}] {message}"
-        self.logger.error(message, exc_info=exc_info)
+            self.logger.error("[%s] %s", correlation_id, message, exc_info=exc_info)
+        else:
+            self.logger.error(message, exc_info=exc_info)
+
+@lru_cache(maxsize=2)
+def get_logger(debug_mode: bool = False) -> ActionServiceLogger:
+    """Shared ActionServiceLogger for the given mode"""
+    return ActionServiceLogger(debug_mode)
+
+def _elapsed_suffix(start_time: Optional[int]) -> str:
+    """Duration suffix for failure messages, empty when timing was skipped"""
+    if start_time is None:
+        return ""
+    return f" after {(time.perf_counter_ns() - start_time) / 1e6:.2f}ms"
 
 def log_execution_time(logger: ActionServiceLogger):
     """Decorator to log execution time of functions"""
     def decorator(func):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
             correlation_id = kwargs.get('correlation_id')
+            debug = logger.logger.isEnabledFor(logging.DEBUG)
+            start_time = time.perf_counter_ns() if debug else None
             
-            logger.debug(
-                f"Starting {func.__name__}",
-                correlation_id=correlation_id
-            )
-            
-            try:
-                result = await func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                
+            if debug:
                 logger.debug(
-                    f"Completed {func.__name__} in {execution_time:.2f}s",
+                    f"Starting {func.__name__}",
                     correlation_id=correlation_id
                 )
+            
+            try:
+                result = await func(*args, **kwargs)
+                if debug:
+                    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+                    logger.debug(
+                        f"Completed {func.__name__} in {elapsed_ms:.2f}ms",
+                        correlation_id=correlation_id
+                    )
                 return result
                 
             except Exception as e:
-                execution_time = time.time() - start_time
                 logger.error(
-                    f"Failed {func.__name__} after {execution_time:.2f}s: {str(e)}",
+                    f"Failed {func.__name__}{_elapsed_suffix(start_time)}: {str(e)}",
                     correlation_id=correlation_id,
                     exc_info=True
                 )
@@ -74,28 +95,29 @@ def log_execution_time(logger: ActionServiceLogger):
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
             correlation_id = kwargs.get('correlation_id')
+            debug = logger.logger.isEnabledFor(logging.DEBUG)
+            start_time = time.perf_counter_ns() if debug else None
             
-            logger.debug(
-                f"Starting {func.__name__}",
-                correlation_id=correlation_id
-            )
-            
-            try:
-                result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                
+            if debug:
                 logger.debug(
-                    f"Completed {func.__name__} in {execution_time:.2f}s",
+                    f"Starting {func.__name__}",
                     correlation_id=correlation_id
                 )
+            
+            try:
+                result = func(*args, **kwargs)
+                if debug:
+                    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+                    logger.debug(
+                        f"Completed {func.__name__} in {elapsed_ms:.2f}ms",
+                        correlation_id=correlation_id
+                    )
                 return result
                 
             except Exception as e:
-                execution_time = time.time() - start_time
                 logger.error(
-                    f"Failed {func.__name__} after {execution_time:.2f}s: {str(e)}",
+                    f"Failed {func.__name__}{_elapsed_suffix(start_time)}: {str(e)}",
                     correlation_id=correlation_id,
                     exc_info=True
                 )
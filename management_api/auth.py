@@ -0,0 +1,25 @@
+"""Authentication dependencies for the Management API"""
+import os
+import secrets
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+_bearer = HTTPBearer(auto_error=False)
+
+def require_admin(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)
+) -> None:
+    """Allow admin operations only with the bearer token in MANAGEMENT_ADMIN_TOKEN"""
+    expected = os.getenv("MANAGEMENT_ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=403, detail="Admin operations are disabled")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), expected.encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
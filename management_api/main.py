@@ -2,28 +2,24 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.responses import RedirectResponse
-import uuid
+import secrets
 
 from .routers import actions, credentials, protocols, monitoring
-from ..log_utils import ActionServiceLogger
+from ..log_utils import get_logger
 
 app = FastAPI(title="Action Service Management API")
-logger = ActionServiceLogger(debug_mode=True)
+logger = get_logger(True)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions"""
-    error_id = str(uuid.uuid4())
+    error_id = secrets.token_hex(16)
     
     # Log the full error details internally
     logger.error(
-        f"Unhandled exception: {str(exc)}",
-        exc_info=True,
-        extra={
-            "error_id": error_id,
-            "url": str(request.url),
-            "method": request.method,
-        }
+        f"Unhandled exception on {request.method} {request.url}: {exc}",
+        correlation_id=error_id,
+        exc_info=True
     )
     
     # Return a sanitized error response
@@ -1,8 +1,8 @@
 """Action management endpoints"""
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 
-from ...log_utils import ActionServiceLogger
+from ...log_utils import get_logger
 from ...types import RepoSet
 from ...usecases.actions import (
     CreateAction, ListActions,
@@ -12,10 +12,10 @@ from ...usecases.actions import (
 from ..settings import get_reposet
 
 router = APIRouter(prefix="/actions", tags=["actions"])
-logger = ActionServiceLogger(debug_mode=True)
+logger = get_logger(True)
 
 @router.post("/", response_model=ActionResponse)
-async def create_action(
+def create_action(
     request: CreateActionRequest,
     reposet: RepoSet = Depends(get_reposet)
 ):
@@ -26,8 +26,10 @@ async def create_action(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=ActionListResponse)
-async def list_actions(
+# Listings are serialized straight from the response model's compiled schema;
+# response_model=None stops FastAPI dumping and re-validating every action.
+@router.get("/", response_model=None, responses={200: {"model": ActionListResponse}})
+def list_actions(
     action_type: Optional[str] = None,
     protocol: Optional[str] = None,
     page: int = Query(1, ge=1),
@@ -36,10 +38,12 @@ async def list_actions(
 ):
     """List actions with optional filters"""
     usecase = ListActions(reposet)
-    request = ListActionsRequest(
+    # Query() has already enforced the bounds; skip a second validation pass
+    request = ListActionsRequest.model_construct(
         action_type=action_type,
         protocol=protocol,
         page=page,
         page_size=page_size
     )
-    return usecase.execute(request)
+    result = usecase.execute(request)
+    return Response(content=result.model_dump_json(), media_type="application/json")
@@ -1,17 +1,21 @@
 """Credential management endpoints"""
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
+from pydantic import TypeAdapter
 
-from ...log_utils import ActionServiceLogger
+from ...log_utils import get_logger
 from ...types import RepoSet
 from ...domain import Credential
 from ..settings import get_reposet
 
 router = APIRouter(prefix="/credentials", tags=["credentials"])
-logger = ActionServiceLogger(debug_mode=True)
+logger = get_logger(True)
+
+# Built once at import; serializes listings without per-request re-validation
+_CREDENTIAL_LIST_ADAPTER = TypeAdapter(List[Credential])
 
 @router.post("/", response_model=Credential)
-async def create_credential(
+def create_credential(
     name: str,
     protocol: str,
     secrets: dict,
@@ -28,12 +32,14 @@ async def create_credential(
             protocol=protocol_obj,
             secrets=secrets
         )
-    except Exception as e:
-        logger.error(f"Failed to store credentials: {str(e)}")
+    except HTTPException:
+        raise
+    except (LookupError, ValueError) as e:
+        logger.error(f"Failed to store credentials: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{credential_id}", response_model=Credential)
-async def get_credential(
+def get_credential(
     credential_id: str,
     reposet: RepoSet = Depends(get_reposet)
 ):
@@ -43,12 +49,14 @@ async def get_credential(
         if not cred:
             raise HTTPException(status_code=404, detail="Credential not found")
         return cred
-    except Exception as e:
-        logger.error(f"Failed to get credential: {str(e)}")
+    except HTTPException:
+        raise
+    except (LookupError, ValueError) as e:
+        logger.error(f"Failed to get credential: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=List[Credential])
-async def list_credentials(
+@router.get("/", response_model=None, responses={200: {"model": List[Credential]}})
+def list_credentials(
     protocol: Optional[str] = None,
     reposet: RepoSet = Depends(get_reposet)
 ):
@@ -56,11 +64,17 @@ async def list_credentials(
     try:
         protocol_obj = None
         if protocol:
-            protocol_obj = reposet.behaviour_repo.get_protocol(protocol)
+            protocol_obj = reposet["behaviour_repository"].get_protocol(protocol)
             if not protocol_obj:
                 raise HTTPException(status_code=400, detail="Invalid protocol")
                 
-        return reposet["credential_repository"].list_credentials(protocol=protocol_obj)
-    except Exception as e:
-        logger.error(f"Failed to list credentials: {str(e)}")
+        credentials = reposet["credential_repository"].list_credentials(protocol=protocol_obj)
+        return Response(
+            content=_CREDENTIAL_LIST_ADAPTER.dump_json(credentials),
+            media_type="application/json"
+        )
+    except HTTPException:
+        raise
+    except (LookupError, ValueError) as e:
+        logger.error(f"Failed to list credentials: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,18 +1,23 @@
 """Event monitoring and result tracking endpoints"""
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
+from pydantic import TypeAdapter
 from datetime import datetime
 
-from ...log_utils import ActionServiceLogger
+from ...log_utils import get_logger
 from ...types import RepoSet
 from ...domain import Event, ActionResult
 from ..settings import get_reposet
 
 router = APIRouter(tags=["monitoring"])
-logger = ActionServiceLogger(debug_mode=True)
+logger = get_logger(True)
 
-@router.get("/events/", response_model=List[Event])
-async def list_events(
+# Built once at import; serializes listings without per-request re-validation
+_EVENT_LIST_ADAPTER = TypeAdapter(List[Event])
+_RESULT_LIST_ADAPTER = TypeAdapter(List[ActionResult])
+
+@router.get("/events/", response_model=None, responses={200: {"model": List[Event]}})
+def list_events(
     action_id: Optional[str] = None,
     status: Optional[str] = None,
     start_time: Optional[datetime] = None,
@@ -21,18 +26,22 @@ async def list_events(
 ):
     """List events with filters"""
     try:
-        return reposet["event_repository"].list_events(
+        events = reposet["event_repository"].list_events(
             action_id=action_id,
             status=status,
             start_time=start_time,
             end_time=end_time
         )
+        return Response(
+            content=_EVENT_LIST_ADAPTER.dump_json(events),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Failed to list events: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/events/{event_id}/status", response_model=str)
-async def get_event_status(
+def get_event_status(
     event_id: str,
     reposet: RepoSet = Depends(get_reposet)
 ):
@@ -46,8 +55,8 @@ async def get_event_status(
         logger.error(f"Failed to get event status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/results/{action_id}", response_model=List[ActionResult])
-async def get_action_results(
+@router.get("/results/{action_id}", response_model=None, responses={200: {"model": List[ActionResult]}})
+def get_action_results(
     action_id: str,
     success: Optional[bool] = None,
     start_time: Optional[datetime] = None,
@@ -56,12 +65,16 @@ async def get_action_results(
 ):
     """Get results for an action"""
     try:
-        return reposet["result_repository"].list_results(
+        results = reposet["result_repository"].list_results(
             action_id=action_id,
             success=success,
             start_time=start_time,
             end_time=end_time
         )
+        return Response(
+            content=_RESULT_LIST_ADAPTER.dump_json(results),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Failed to get results: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,28 +1,70 @@
 """Protocol and behavior management endpoints"""
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Callable, Dict, List, Sequence, Tuple
+import time
+from weakref import WeakKeyDictionary
 
-from ...log_utils import ActionServiceLogger
+from fastapi import APIRouter, HTTPException, Depends, Response
+from pydantic import TypeAdapter
+
+from ...log_utils import get_logger
 from ...types import RepoSet
 from ...domain import Protocol, ActionType
+from ..auth import require_admin
 from ..settings import get_reposet
 
 router = APIRouter(tags=["protocols"])
-logger = ActionServiceLogger(debug_mode=True)
+logger = get_logger(True)
+
+# Built once at import; serializes listings without per-request re-validation
+_PROTOCOL_LIST_ADAPTER = TypeAdapter(List[Protocol])
+_ACTION_TYPE_LIST_ADAPTER = TypeAdapter(List[ActionType])
+
+# The behaviour catalogue is near-static, so serialized listings are reused
+# until they expire or /admin/reload-protocols clears them. Listings are kept
+# per repository instance, so reposets and dependency overrides never share them.
+_CATALOGUE_TTL = 60.0
+_catalogue_cache: WeakKeyDictionary[object, Dict[str, Tuple[float, bytes]]] = WeakKeyDictionary()
 
-@router.get("/protocols/", response_model=List[Protocol])
-async def list_protocols(
+def _cached_listing(
+    repository: object,
+    key: str,
+    load: Callable[[], Sequence],
+    adapter: TypeAdapter
+) -> bytes:
+    """Serialized catalogue listing, reloaded once the cached copy expires"""
+    now = time.monotonic()
+    listings = _catalogue_cache.get(repository)
+    if listings is None:
+        listings = _catalogue_cache.setdefault(repository, {})
+    entry = listings.get(key)
+    if entry is None or entry[0] <= now:
+        entry = (now + _CATALOGUE_TTL, adapter.dump_json(load()))
+        listings[key] = entry
+    return entry[1]
+
+@router.get("/protocols/", response_model=None, responses={200: {"model": List[Protocol]}})
+def list_protocols(
     reposet: RepoSet = Depends(get_reposet)
 ):
     """List available protocols"""
     try:
-        return reposet["behaviour_repository"].get_protocols()
+        repository = reposet["behaviour_repository"]
+        body = _cached_listing(
+            repository,
+            "protocols",
+            repository.get_protocols,
+            _PROTOCOL_LIST_ADAPTER
+        )
+        return Response(
+            content=body,
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Failed to list protocols: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/protocols/{protocol_id}", response_model=Protocol)
-async def get_protocol(
+def get_protocol(
     protocol_id: str,
     reposet: RepoSet = Depends(get_reposet)
 ):
@@ -36,13 +78,29 @@ async def get_protocol(
         logger.error(f"Failed to get protocol: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/action-types/", response_model=List[ActionType])
-async def list_action_types(
+@router.get("/action-types/", response_model=None, responses={200: {"model": List[ActionType]}})
+def list_action_types(
     reposet: RepoSet = Depends(get_reposet)
 ):
     """List available action types"""
     try:
-        return reposet["behaviour_repository"].get_action_types()
+        repository = reposet["behaviour_repository"]
+        body = _cached_listing(
+            repository,
+            "action_types",
+            repository.get_action_types,
+            _ACTION_TYPE_LIST_ADAPTER
+        )
+        return Response(
+            content=body,
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Failed to list action types: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/admin/reload-protocols", status_code=204, dependencies=[Depends(require_admin)])
+def reload_protocols():
+    """Drop cached protocol and action type listings"""
+    _catalogue_cache.clear()
+    return Response(status_code=204)
@@ -2,7 +2,8 @@
 Protocol Development Kit (PDK) - The building blocks for creating new protocols
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from types import MappingProxyType
 from pydantic import BaseModel, ConfigDict
 
@@ -18,9 +19,25 @@ class ProtocolConfig(BaseModel):
         validate_assignment=True  # Validate on attribute assignment
     )
 
+# Config values of these types are immutable, so a cached view can share them
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+@lru_cache(maxsize=256)
+def _config_model_for(fields: Tuple[Tuple[str, type], ...]) -> Type[BaseModel]:
+    """Frozen config model for a (name, type) field layout, built once per layout"""
+    return type('ConfigModel', (BaseModel,), {
+        '__annotations__': dict(fields),
+        'model_config': ConfigDict(frozen=True)
+    })
+
 class ProtocolHandler(ABC):
-    """Base class for all protocol implementations"""
-    
+    """Base class for all protocol implementations
+
+    Subclasses should declare ``__slots__`` (``()`` if they add no
+    attributes) to keep instances free of a per-instance ``__dict__``.
+    """
+    __slots__ = ('_config', '_config_view', 'last_error')
+
     def __init__(self, config: Union[List[ConfigValue], Dict[str, Any]]):
         # Convert list of ConfigValue to dict if needed
         if isinstance(config, list):
@@ -28,20 +45,30 @@ class ProtocolHandler(ABC):
         else:
             config_dict = config
 
-        # Create dynamic model with frozen config
-        ConfigModel = type('ConfigModel', (BaseModel,), {
-            '__annotations__': {k: type(v) for k, v in config_dict.items()},
-            'model_config': ConfigDict(frozen=True)  # Use ConfigDict instead of class Config
-        })
+        # Handlers sharing a config layout share one compiled model
+        ConfigModel = _config_model_for(
+            tuple((k, type(v)) for k, v in config_dict.items())
+        )
         
         # Store as immutable model
         self._config = ConfigModel(**config_dict)
+        # The model is frozen, so a dump of scalar values serves every later
+        # access; nested containers are mutable and are dumped afresh each time
+        dump = self._config.model_dump()
+        self._config_view = (
+            MappingProxyType(dump)
+            if all(value.__class__ in _SCALAR_TYPES for value in dump.values())
+            else None
+        )
         self.last_error: Optional[str] = None
     
     @property
     def config(self) -> Dict[str, Any]:
         """Get config as immutable dictionary"""
-        return MappingProxyType(self._config.model_dump())
+        view = self._config_view
+        if view is None:
+            return MappingProxyType(self._config.model_dump())
+        return view
     
     @abstractmethod
     def execute(self, action: Action) -> ActionResult:
@@ -64,7 +91,8 @@ class ProtocolHandler(ABC):
 
 class ExampleProtocol(ProtocolHandler):
     """Example implementation showing protocol structure"""
-    
+    __slots__ = ()
+
     def connect_to_service(self, config: Dict[str, Any]) -> Any:
         """Example connection logic"""
         import httpx
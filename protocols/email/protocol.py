@@ -8,16 +8,68 @@ This protocol allows monitoring of email inboxes via IMAP, with support for:
 - Extracting message content
 """
 
+import atexit
+import hashlib
+import hmac
 import imaplib
-import email
+import secrets
+import time
+from contextlib import contextmanager
+from email import policy
 from email.message import EmailMessage
-from typing import Dict, Any, Optional, List, Tuple
+from email.parser import BytesParser
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
+import re
+import threading
 import uuid
 from datetime import datetime
 
 from ...pdk import ProtocolHandler
 from ...domain import Action, ActionResult
 
+# Idle logged-in clients with the time they went idle, keyed by (host, port,
+# use_ssl, username, password digest). A client is checked out for the length
+# of one execute, so no two threads ever share a session.
+_IMAP_POOL: Dict[Tuple[str, int, bool, str, bytes], List[Tuple[imaplib.IMAP4, float]]] = {}
+_IMAP_POOL_LOCK = threading.Lock()
+_IMAP_MAX_IDLE_PER_KEY = 4  # Idle clients kept per account; extras are logged out
+_IMAP_IDLE_TIMEOUT = 300.0  # Seconds an idle client is kept before logging out
+# Per-process key, so pool keys never hold or reveal a plain password digest
+_IMAP_POOL_KEY = secrets.token_bytes(32)
+
+# UID of a message in a UID FETCH response header, e.g. b'3 (UID 1204 BODY[] {512}'
+_UID_PATTERN = re.compile(rb'UID (\d+)')
+
+def _quote(value: str) -> str:
+    """Quote a SEARCH argument as an IMAP quoted string"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _imap_date(value: Union[datetime, str]) -> str:
+    """Format a SEARCH date as DD-Mon-YYYY"""
+    if isinstance(value, datetime):
+        return value.strftime("%d-%b-%Y")
+    return value
+
+# Modern-policy parser: yields EmailMessage objects with get_body()/get_content()
+_PARSER = BytesParser(policy=policy.default)
+
+def _discard(client: imaplib.IMAP4) -> None:
+    """Close a client that can no longer be reused"""
+    try:
+        client.logout()
+    except (imaplib.IMAP4.error, OSError):
+        pass
+
+def close_idle_connections() -> None:
+    """Log out every idle pooled client; run at interpreter exit"""
+    with _IMAP_POOL_LOCK:
+        idle = [client for clients in _IMAP_POOL.values() for client, _ in clients]
+        _IMAP_POOL.clear()
+    for client in idle:
+        _discard(client)
+
+atexit.register(close_idle_connections)
+
 class EmailProtocol(ProtocolHandler):
     """
     IMAP Email Protocol Handler
@@ -43,15 +95,16 @@ class EmailProtocol(ProtocolHandler):
         - port: IMAP port (default: 993 for SSL)
         - use_ssl: Whether to use SSL (default: True)
         """
+        config = self.config
         required = ['host', 'username', 'password', 'folder']
-        if not all(k in self.config for k in required):
-            self.last_error = f"Missing required fields: {[k for k in required if k not in self.config]}"
+        if not all(k in config for k in required):
+            self.last_error = f"Missing required fields: {[k for k in required if k not in config]}"
             return False
             
         # Validate port if provided
-        if 'port' in self.config:
+        if 'port' in config:
             try:
-                port = int(self.config['port'])
+                port = int(config['port'])
                 if port < 1 or port > 65535:
                     self.last_error = "Port must be between 1 and 65535"
                     return False
@@ -96,7 +149,7 @@ class EmailProtocol(ProtocolHandler):
         6. Update message flags if needed
         """
         try:
-            with self._get_connection() as client:
+            with self._pooled_connection() as client:
                 # Select the mailbox folder
                 client.select(self.config['folder'])
                 
@@ -104,36 +157,46 @@ class EmailProtocol(ProtocolHandler):
                 search_criteria = self._build_search_criteria(action.config)
                 
                 # Search for messages
-                # IMAP SEARCH returns message numbers that match ALL criteria
-                typ, message_numbers = client.search(None, *search_criteria)
+                # UID SEARCH returns the permanent UIDs that match ALL criteria
+                typ, search_data = client.uid('SEARCH', None, *search_criteria)
                 if typ != 'OK':
-                    raise RuntimeError(f"Search failed: {message_numbers[0].decode()}")
+                    raise RuntimeError(f"Search failed: {search_data[0].decode()}")
                 
                 messages = []
-                for num in message_numbers[0].split():
-                    # Fetch message content
+                uids = search_data[0].split()
+                if uids:
+                    # Fetch every match in one round trip using a UID set
                     # Use BODY.PEEK instead of RFC822 to not mark as read automatically
-                    typ, msg_data = client.fetch(num, '(BODY.PEEK[])')
+                    typ, msg_data = client.uid('FETCH', b','.join(uids), '(BODY.PEEK[])')
                     if typ != 'OK':
-                        continue
-                        
-                    email_body = msg_data[0][1]
-                    email_message = email.message_from_bytes(email_body)
+                        raise RuntimeError(f"Fetch failed: {msg_data[0]}")
                     
-                    # Extract message details
-                    message = {
-                        'id': num.decode(),
-                        'subject': email_message['subject'],
-                        'from': email_message['from'],
-                        'date': email_message['date'],
-                        'body': self._get_message_body(email_message)
-                    }
-                    messages.append(message)
+                    # Each message arrives as a (b'<num> (UID <uid> BODY[] {size}', body)
+                    # tuple, followed by a closing b')' entry
+                    fetched = []
+                    for item in msg_data:
+                        if not isinstance(item, tuple):
+                            continue
+                        match = _UID_PATTERN.search(item[0])
+                        if match is None:
+                            continue
+                        uid = match.group(1)
+                        email_message = _PARSER.parsebytes(item[1])
+                        
+                        # Extract message details
+                        messages.append({
+                            'id': uid.decode(),
+                            'subject': email_message['subject'],
+                            'from': email_message['from'],
+                            'date': email_message['date'],
+                            'body': self._get_message_body(email_message)
+                        })
+                        fetched.append(uid)
                     
-                    # Mark as seen if configured
+                    # Mark as seen if configured, in a single UID STORE
                     # This explicitly sets the \\Seen flag
-                    if action.config.get('mark_seen', True):
-                        client.store(num, '+FLAGS', '\\\\Seen')
+                    if fetched and action.config.get('mark_seen', True):
+                        client.uid('STORE', b','.join(fetched), '+FLAGS', '\\\\Seen')
                 
                 return ActionResult(
                     action_id=action.id,
@@ -159,20 +222,83 @@ class EmailProtocol(ProtocolHandler):
         
         Note: Uses context manager pattern for automatic cleanup
         """
-        if self.config.get('use_ssl', True):
+        config = self.config
+        if config.get('use_ssl', True):
             client = imaplib.IMAP4_SSL(
-                host=self.config['host'],
-                port=int(self.config.get('port', 993))
+                host=config['host'],
+                port=int(config.get('port', 993))
             )
         else:
             client = imaplib.IMAP4(
-                host=self.config['host'],
-                port=int(self.config.get('port', 143))
+                host=config['host'],
+                port=int(config.get('port', 143))
             )
             
-        client.login(self.config['username'], self.config['password'])
+        client.login(config['username'], config['password'])
         return client
         
+    @contextmanager
+    def _pooled_connection(self) -> Iterator[imaplib.IMAP4]:
+        """
+        Check out a logged-in IMAP client, reusing an idle one when possible
+        
+        Idle clients are probed with NOOP before reuse. A client that fails
+        with a connection error is logged out instead of being returned, as
+        are clients idle for longer than _IMAP_IDLE_TIMEOUT and any beyond
+        _IMAP_MAX_IDLE_PER_KEY.
+        """
+        config = self.config
+        use_ssl = config.get('use_ssl', True)
+        key = (
+            config['host'],
+            int(config.get('port', 993 if use_ssl else 143)),
+            use_ssl,
+            config['username'],
+            hmac.digest(_IMAP_POOL_KEY, str(config['password']).encode(), hashlib.sha256)
+        )
+        
+        client = None
+        expired = []
+        with _IMAP_POOL_LOCK:
+            idle = _IMAP_POOL.get(key)
+            if idle:
+                # Entries are in the order they went idle, so stale ones lead
+                cutoff = time.monotonic() - _IMAP_IDLE_TIMEOUT
+                while idle and idle[0][1] < cutoff:
+                    expired.append(idle.pop(0)[0])
+                if idle:
+                    client = idle.pop()[0]
+                if not idle:
+                    del _IMAP_POOL[key]
+        for stale in expired:
+            _discard(stale)
+        if client is not None:
+            try:
+                client.noop()
+            except (imaplib.IMAP4.error, OSError):
+                _discard(client)
+                client = None
+        if client is None:
+            client = self._get_connection()
+        
+        reusable = True
+        try:
+            yield client
+        except (imaplib.IMAP4.abort, OSError):
+            reusable = False
+            raise
+        finally:
+            if reusable:
+                with _IMAP_POOL_LOCK:
+                    idle = _IMAP_POOL.setdefault(key, [])
+                    if len(idle) < _IMAP_MAX_IDLE_PER_KEY:
+                        idle.append((client, time.monotonic()))
+                        client = None
+                if client is not None:
+                    _discard(client)
+            else:
+                _discard(client)
+        
     def _build_search_criteria(self, config: Dict[str, Any]) -> List[str]:
         """
         Build IMAP SEARCH command criteria
@@ -182,22 +308,24 @@ class EmailProtocol(ProtocolHandler):
         - UNSEEN: Messages without \\Seen flag
         - SUBJECT "text": Messages with text in subject
         - FROM "addr": Messages from specific address
-        - SINCE "date": Messages after date
+        - SINCE "date": Messages on or after date
+        - BEFORE "date": Messages before date
+        
+        Text arguments are sent as quoted strings so values containing
+        spaces or quotes reach the server intact.
         """
         criteria = []
         
         # Add search filters
         if 'subject' in config:
-            criteria.extend(['SUBJECT', config['subject']])
+            criteria.extend(['SUBJECT', _quote(config['subject'])])
         if 'from' in config:
-            criteria.extend(['FROM', config['from']])
+            criteria.extend(['FROM', _quote(config['from'])])
+        # IMAP date format: DD-Mon-YYYY
         if 'since' in config:
-            # IMAP date format: DD-Mon-YYYY
-            if isinstance(config['since'], datetime):
-                date_str = config['since'].strftime("%d-%b-%Y")
-            else:
-                date_str = config['since']
-            criteria.extend(['SINCE', date_str])
+            criteria.extend(['SINCE', _imap_date(config['since'])])
+        if 'before' in config:
+            criteria.extend(['BEFORE', _imap_date(config['before'])])
         if config.get('unseen_only', False):
             criteria.append('UNSEEN')
             
@@ -209,19 +337,8 @@ class EmailProtocol(ProtocolHandler):
         Extract message body with proper handling of MIME parts
         
         Prefers text/plain over text/html for simplicity.
-        Handles both multipart and simple messages.
+        get_body() picks the part in a single MIME traversal and
+        get_content() decodes transfer encoding and charset.
         """
-        if message.is_multipart():
-            # Walk through message parts looking for text content
-            for part in message.walk():
-                if part.get_content_type() == "text/plain":
-                    return part.get_payload(decode=True).decode()
-            # Fallback to first text part if no plain text
-            for part in message.walk():
-                if part.get_content_type().startswith("text/"):
-                    return part.get_payload(decode=True).decode()
-        else:
-            # Simple messages can be decoded directly
-            return message.get_payload(decode=True).decode()
-        
-        return ""  # Empty string if no text content found
+        body = message.get_body(preferencelist=('plain', 'html'))
+        return body.get_content() if body is not None else ""
@@ -6,13 +6,15 @@ import httpx
 from jinja2 import Environment, FileSystemLoader
 
 from ...domain import Action, ActionResult
+from ...http_client import get_http_client
 from ...pdk import ProtocolHandler
 
 class GithubProtocol(ProtocolHandler):
     """Handles GitHub API interactions"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], client: Optional[httpx.Client] = None):
         super().__init__(config)
+        self.client = client  # Falls back to the shared client
         self.template_dir = os.path.join(os.path.dirname(__file__), 'templates')
         self.env = Environment(
             loader=FileSystemLoader(self.template_dir),
@@ -37,10 +39,11 @@ class GithubProtocol(ProtocolHandler):
     def test_connection(self) -> bool:
         """Test GitHub API connection"""
         try:
-            headers = {'Authorization': f"token {self.config['token']}"}
-            url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}"
+            config = self.config
+            headers = {'Authorization': f"token {config['token']}"}
+            url = f"https://api.github.com/repos/{config['repo_owner']}/{config['repo_name']}"
             
-            response = httpx.get(url, headers=headers)
+            response = (self.client or get_http_client()).get(url, headers=headers)
             response.raise_for_status()
             
             self.last_error = None
@@ -67,7 +70,7 @@ class GithubProtocol(ProtocolHandler):
             headers = {'Authorization': f"token {config_dict['token']}"}
             url = f"https://api.github.com/repos/{config_dict['repo_owner']}/{config_dict['repo_name']}/issues"
             
-            response = httpx.post(url, headers=headers, json=payload)
+            response = (self.client or get_http_client()).post(url, headers=headers, json=payload)
             response.raise_for_status()
 
             response_data = response.json()
@@ -4,7 +4,8 @@ from ..interfaces.protocol import ProtocolHandler
 
 class HttpProtocol(ProtocolHandler):
     """HTTP protocol implementation"""
-    
+    __slots__ = ()
+
     def validate_config(self) -> bool:
         """Validate protocol configuration"""
         required_fields = ['url']
@@ -42,7 +43,8 @@ from ..interfaces.protocol import ProtocolHandler
 
 class HttpProtocol(ProtocolHandler):
     """HTTP protocol implementation"""
-    
+    __slots__ = ()
+
     def validate_config(self) -> bool:
         """Validate protocol configuration"""
         required_fields = ['url']
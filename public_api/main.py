@@ -8,7 +8,7 @@ from datetime import datetime, UTC
 from typing import Dict, Optional
 from json.decoder import JSONDecodeError
 
-from ..log_utils import ActionServiceLogger, log_execution_time
+from ..log_utils import get_logger, log_execution_time
 
 def normalize_content_type(content_type: str) -> str:
     """Extract base content type without parameters"""
@@ -26,7 +26,7 @@ from ..usecases.webhooks import ReceiveWebhook, GetWebhookStatus
 from .settings import get_reposet
 
 app = FastAPI(title="Action Service Public API")
-logger = ActionServiceLogger(debug_mode=True)  # Configure via environment/settings
+logger = get_logger(True)  # Configure via environment/settings
  
 @app.post(
     "/webhooks/{webhook_id}",
@@ -3,13 +3,13 @@ from functools import lru_cache
 import os
 
 from ..types import RepoSet
-from ..base_settings import get_base_reposet, validate_base_settings
+from ..base_settings import get_mutable_base_reposet, validate_base_settings
 from ..repositories.s3 import S3WebhookRepository
 
 @lru_cache()
 def get_reposet() -> RepoSet:
     """Get repository set for API, overriding webhook repo with S3 implementation"""
-    repos = get_base_reposet()
+    repos = get_mutable_base_reposet()
     # Override webhook repository with S3 implementation
     repos["webhook_repository"] = S3WebhookRepository(
         endpoint_url=os.getenv('MINIO_ENDPOINT', 'http://minio:9000'),
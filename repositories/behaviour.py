@@ -1,5 +1,6 @@
 """Implementation of the behaviour catalogue using hardcoded data"""
 
+import re
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from ..interfaces.repositories import BehaviourRepository
@@ -112,7 +113,7 @@ _PROTOCOLS = [
         description="HTTP-based REST APIs",
         category="web",
         handler_class="action_service.protocols.http.HttpProtocol",
-        supported_semantics=[_AT_LEAST_ONCE],
+        supported_semantics=(_AT_LEAST_ONCE,),
         default_policy=_DEFAULT_HTTP_POLICY
     ),
     Protocol(
@@ -121,7 +122,7 @@ _PROTOCOLS = [
         description="Send emails via SMTP",
         category="email",
         handler_class="action_service.protocols.email.SmtpProtocol",
-        supported_semantics=[_AT_LEAST_ONCE],
+        supported_semantics=(_AT_LEAST_ONCE,),
         default_policy=_DEFAULT_EMAIL_POLICY
     ),
     Protocol(
@@ -130,7 +131,7 @@ _PROTOCOLS = [
         description="GitHub Issues and PRs",
         category="development",
         handler_class="action_service.protocols.github.GithubProtocol",
-        supported_semantics=[_EXACTLY_ONCE],
+        supported_semantics=(_EXACTLY_ONCE,),
         default_policy=_DEFAULT_GITHUB_POLICY
     ),
     Protocol(
@@ -139,7 +140,7 @@ _PROTOCOLS = [
         description="Kafka message streams",
         category="messaging",
         handler_class="action_service.protocols.kafka.KafkaProtocol",
-        supported_semantics=[_AT_LEAST_ONCE],
+        supported_semantics=(_AT_LEAST_ONCE,),
         default_policy=_DEFAULT_KAFKA_POLICY
     )
 ]
@@ -231,24 +232,24 @@ class HardcodedBehaviourCatalogue(BehaviourRepository):
                     type="str",
                     description="The endpoint URL",
                     required=True,
-                    validation_rules=[
+                    validation_rules=(
                         ValidationRule(
                             rule_type="pattern",
                             value=r"^https?://.*",
                             message="URL must start with http:// or https://"
-                        )
-                    ]
+                        ),
+                    )
                 ),
                 "method": PropertyDefinition(
                     type="str",
                     description="HTTP method to use",
                     default="GET",
-                    validation_rules=[
+                    validation_rules=(
                         ValidationRule(
                             rule_type="choices",
-                            value=["GET", "POST", "PUT", "DELETE"]
-                        )
-                    ]
+                            value=("GET", "POST", "PUT", "DELETE")
+                        ),
+                    )
                 ),
                 "headers": PropertyDefinition(
                     type="dict",
@@ -278,7 +279,6 @@ class HardcodedBehaviourCatalogue(BehaviourRepository):
                     if hasattr(field_def, 'validation_rules'):
                         for rule in field_def.validation_rules:
                             if rule.rule_type == "pattern":
-                                import re
                                 if not re.match(rule.value, str(field_value)):
                                     return False
                             elif rule.rule_type == "choices":
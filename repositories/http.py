@@ -22,11 +22,11 @@ class HttpActionRepository(ActionExecutor):
         """Execute an HTTP action."""
         with httpx.Client() as client:
             response = client.request(
-                method=action.config.get('method', 'GET'),
-                url=action.config['url'],
-                headers={**self.headers, **action.config.get('headers', {})},
-                json=action.config.get('body'),
-                params=action.config.get('params')
+                method=action.get_config('method', 'GET'),
+                url=action.get_config('url'),
+                headers={**self.headers, **action.get_config('headers', {})},
+                json=action.get_config('body'),
+                params=action.get_config('params')
             )
             response.raise_for_status()
             return {'status': response.status_code, 'data': response.json()}
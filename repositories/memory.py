@@ -1,8 +1,9 @@
 """In-memory implementations of repositories required by public API"""
+from dataclasses import replace
 from typing import Dict, Optional, Any, List
 from datetime import datetime, UTC
 from uuid import uuid4
-from ..log_utils import ActionServiceLogger
+from ..log_utils import get_logger
 from ..domain.direction import ActionDirection
 
 from ..domain import (
@@ -155,7 +156,7 @@ class InMemoryEventRepository(EventRepository):
     def __init__(self):
         self._events: Dict[str, Event] = {}
         self._statuses: Dict[str, EventStatus] = {}
-        self.logger = ActionServiceLogger()
+        self.logger = get_logger()
         
     def record_event(self,
         action_id: str,
@@ -255,17 +256,6 @@ class InMemoryEventRepository(EventRepository):
         end_time: Optional[datetime] = None
     ) -> List[Event]:
         """Query events with filters"""
-        matching_events = [e for e in self._events.values() 
-                         if (not action_id or e.get("action_id") == action_id)
-                         and (not status or e.get("status") == status)
-                         and (not start_time or e.get("timestamp") >= start_time)
-                         and (not end_time or e.get("timestamp") <= end_time)]
-        
-        self.logger.debug(
-            f"Listing events: filter_action={action_id}, filter_status={status}, "
-            f"total_events={len(self._events)}, matching_events={len(matching_events)}, "
-            f"date_range={start_time and start_time.isoformat()} to {end_time and end_time.isoformat()}"
-        )
         events = []
         for event in self._events.values():
             if action_id and event.get("action_id") != action_id:
@@ -277,6 +267,12 @@ class InMemoryEventRepository(EventRepository):
             if end_time and event.get("timestamp") > end_time:
                 continue
             events.append(event)
+
+        self.logger.debug(
+            f"Listing events: filter_action={action_id}, filter_status={status}, "
+            f"total_events={len(self._events)}, matching_events={len(events)}, "
+            f"date_range={start_time and start_time.isoformat()} to {end_time and end_time.isoformat()}"
+        )
         return events
 
 class InMemoryCredentialRepository(CredentialRepository):
@@ -354,18 +350,17 @@ class InMemoryResultRepository(ResultRepository):
         end_time: Optional[datetime] = None
     ) -> List[ActionResult]:
         """Query results with filters"""
-        results = []
-        for result in self._results.values():
-            if result.action_id != action_id:
-                continue
-            if success is not None and result.success != success:
-                continue
-            if start_time and result.timestamp < start_time:
-                continue
-            if end_time and result.timestamp > end_time:
-                continue
-            results.append(result)
-        return results
+        # store_result keys results by action_id, so this is a direct lookup
+        result = self._results.get(action_id)
+        if result is None:
+            return []
+        if success is not None and result.success != success:
+            return []
+        if start_time and result.timestamp < start_time:
+            return []
+        if end_time and result.timestamp > end_time:
+            return []
+        return [result]
 
 class InMemoryMessageRepository(MessageRepository):
     """In-memory implementation of message repository"""
@@ -455,11 +450,11 @@ class InMemoryMessageRepository(MessageRepository):
         message = self._messages[message_id]
         
         # Create new message with acknowledgment
-        updated = Message(
-            **{**message.__dict__,
-               'acknowledged_by': acknowledged_by,
-               'acknowledged_at': datetime.now(UTC),
-               'acknowledgment_notes': notes}
+        updated = replace(
+            message,
+            acknowledged_by=acknowledged_by,
+            acknowledged_at=datetime.now(UTC),
+            acknowledgment_notes=notes
         )
         self._messages[message_id] = updated
         return updated
@@ -473,7 +468,7 @@ class InMemoryMessageRepository(MessageRepository):
             raise ValueError(f"Message not found: {message_id}")
             
         message = self._messages[message_id]
-        updated = Message(**{**message.__dict__, **updates})
+        updated = replace(message, **updates)
         self._messages[message_id] = updated
         return updated
 
@@ -2,7 +2,7 @@
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from ..domain.direction import ActionDirection
-from ..log_utils import ActionServiceLogger
+from ..log_utils import get_logger
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 import os
@@ -18,7 +18,7 @@ class PostgresStreamRepository(ActionRepository):
     def __init__(self):
         self.engine = create_engine(os.getenv('DATABASE_URL'))
         self.Session = sessionmaker(bind=self.engine)
-        self.logger = ActionServiceLogger()
+        self.logger = get_logger()
 
     def create_action(self, 
         name: str,
@@ -102,7 +102,7 @@ class PostgresResultRepository(ResultRepository):
     def __init__(self):
         self.engine = create_engine(os.getenv('DATABASE_URL'))
         self.Session = sessionmaker(bind=self.engine)
-        self.logger = ActionServiceLogger()
+        self.logger = get_logger()
 
     def store_result(self,
         action_id: str,
@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import uuid4
 import boto3
 import base64
-from ..log_utils import ActionServiceLogger
+from ..log_utils import get_logger
 from botocore.exceptions import ClientError
 from botocore.config import Config
 
@@ -24,7 +24,7 @@ class S3WebhookRepository(WebhookRepository):
         bucket: str,
         use_ssl: bool = True
     ):
-        self.logger = ActionServiceLogger()
+        self.logger = get_logger()
         self.client = boto3.client(
             's3',
             endpoint_url=endpoint_url,
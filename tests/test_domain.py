@@ -1,10 +1,11 @@
 from datetime import datetime
 import pytest
 from ..domain import (
-    Action, Protocol, Connection, ConnectionStatus,
+    Action, ActionResult, BulkActionResult, Protocol, Connection, ConnectionStatus,
     ProtocolConfig, ProtocolConfigSchema, ActionTemplate,
     Metric, ConfigValue, PropertyDefinition,
-    RoutingRule, RoutingConfiguration
+    RoutingRule, RoutingConfiguration, ActionDirection, Secret, SecretCollection,
+    DeliveryPolicy, DeliverySemantic, Message, MessageLevel, MessageTarget, MetadataField
 )
 
 @pytest.fixture
@@ -56,6 +57,69 @@ def test_action_lifecycle(catalogue, sample_action):  # Use fixtures
     assert action.protocol == http_protocol
     assert action.schedule == "0 7 * * *"
 
+def test_catalogue_types_are_hashable(catalogue):
+    """Protocols and action types can be used as dict keys and set members"""
+    http = catalogue.get_protocol("http")
+    assert isinstance(http.supported_semantics, tuple)
+    assert hash(http) == hash(catalogue.get_protocol("http"))
+    by_protocol = {http: ["test-1"]}
+    assert by_protocol[catalogue.get_protocol("http")] == ["test-1"]
+    assert catalogue.get_action_type("poll") in {catalogue.get_action_type("poll")}
+
+def test_bulk_action_result_aggregation():
+    """Numeric history metrics are collected into per-name columns"""
+    results = [
+        ActionResult(
+            action_id="test-1",
+            request_id=f"req-{i}",
+            success=True,
+            history=[
+                Metric(name="execution_time", value=float(i)),
+                Metric(name="status", value="ok")
+            ]
+        )
+        for i in range(1, 4)
+    ]
+    bulk = BulkActionResult.from_results(results)
+    assert bulk.result_count == 3
+    assert bulk.mean("execution_time") == 2.0
+    assert "status" not in bulk.history
+    assert bulk.mean("missing") is None
+
+    # Result sequences default to fresh lists that callers can append to
+    result = ActionResult(action_id="test-1", request_id="req-4", success=True)
+    result.history.append(Metric(name="execution_time", value=4.0))
+    assert ActionResult(action_id="test-1", request_id="req-5", success=True).history == []
+
+def test_action_config_lookup(sample_action):
+    """Config values are looked up by name whatever shape config takes"""
+    action = sample_action
+    assert action.get_config("url") == "https://api.weather.com/daily"
+    assert action.get_config("timeout", 30) == 30
+
+    # Reassigning config invalidates the cached index
+    action.config = [ConfigValue(name="url", value="https://example.com")]
+    assert action.get_config("url") == "https://example.com"
+    assert action.get_config("method") is None
+
+    # So do in-place edits of config and metadata lists
+    action.config.append(ConfigValue(name="method", value="POST"))
+    assert action.get_config("method") == "POST"
+    assert action.get_metadata("owner") is None
+    action.metadata.append(MetadataField(name="owner", value="ops", category="user"))
+    assert action.get_metadata("owner").value == "ops"
+
+    # Actions built by pydantic validation look up values too
+    from pydantic import TypeAdapter
+    adapter = TypeAdapter(Action)
+    validated = adapter.validate_python(adapter.dump_python(action))
+    assert validated.get_config("method") == "POST"
+    assert validated.get_metadata("owner").value == "ops"
+
+    action.config = {"method": "PUT"}
+    assert action.get_config("method") == "PUT"
+    assert "_config_index" not in Action.__dataclass_fields__
+
 def test_connection_states(catalogue):  # Add catalogue here too for consistency
     """Document connection lifecycle and state transitions"""
     conn = Connection(
@@ -77,6 +141,7 @@ def test_connection_states(catalogue):  # Add catalogue here too for consistency
     error_status = catalogue.get_connection_status("error")
     
     assert conn.status == active_status
+    assert conn.created_at is not None and conn.created_at == conn.updated_at
     
     # Document state transitions
     conn.status = error_status
@@ -117,6 +182,23 @@ def test_routing_configuration():
     assert routing.strategy == "priority"
     assert routing.fallback.destination == "dead-letter-queue"
 
+    # Priority order is computed once, highest first
+    routing = RoutingConfiguration(rules=[rule2, rule1], strategy="priority")
+    assert [r.name for r in routing.rules_by_priority] == ["high-priority", "normal"]
+
+def test_routing_rule_condition():
+    """Dot-notation conditions are resolved against the message"""
+    rule = RoutingRule(name="urgent", destination="queue-1", condition="headers.urgent")
+    assert rule.matches({"headers": {"urgent": True}})
+    assert not rule.matches({"headers": {"urgent": False}})
+    assert not rule.matches({"body": "no headers"})
+    assert RoutingRule(name="any", destination="queue-2").matches({})
+
+    # The split path and priority order are private slots, not serialized fields
+    from pydantic import TypeAdapter
+    dumped = TypeAdapter(RoutingConfiguration).dump_python(RoutingConfiguration(rules=[rule]))
+    assert "_by_priority" not in dumped and "_condition_path" not in dumped["rules"][0]
+
 def test_action_templates():
     """Test action template functionality"""
     template = ActionTemplate(
@@ -135,3 +217,115 @@ def test_action_templates():
         description="XML greeting template"
     )
     assert custom_template.content_type == "text/xml+jinja2"
+
+def test_action_direction_aliases():
+    """Direction aliases validate and normalize to canonical values"""
+    assert ActionDirection.is_valid("outbound")
+    assert not ActionDirection.is_valid("sideways")
+    assert ActionDirection.normalize("outbound") == ActionDirection.EFFERENT
+    assert ActionDirection.normalize("inbound") == ActionDirection.AFFERENT
+    assert ActionDirection.normalize("efferent") == "efferent"
+    with pytest.raises(ValueError):
+        ActionDirection.normalize("sideways")
+
+def test_secret_collection_keys():
+    """Secrets must be stored under their own key"""
+    token = Secret(key="token", value="encrypted", type="token")
+    secrets = {"token": token}
+    collection = SecretCollection(secrets=secrets)
+    assert collection.get_secret("token") is token
+    secrets["other"] = Secret(key="other", value="encrypted", type="password")
+    assert str(collection) == "SecretCollection(keys=['token'])"
+    assert str(token) == repr(token) == "Secret(key='token', type='token')"
+    from pydantic import TypeAdapter
+    assert TypeAdapter(SecretCollection).dump_python(collection, mode="json") == {"secrets": {"token": {
+        "key": "token", "value": "encrypted", "type": "token", "description": None, "expires_at": None
+    }}}
+    with pytest.raises(ValueError) as exc:
+        SecretCollection(secrets={"api": token})
+    assert "Secret key mismatch: api != token" in str(exc.value)
+
+def test_delivery_policy_constraints():
+    """Policies must respect their semantic's guarantees"""
+    at_most_once = DeliverySemantic(
+        id="at_most_once", name="At Most Once", description="Fire and forget",
+        requires_ack=False, allows_retry=False, preserves_order=False, requires_dedup=False
+    )
+    assert DeliveryPolicy(semantic=at_most_once, max_retries=0).max_retries == 0
+    from pydantic import TypeAdapter
+    assert "_mask" not in TypeAdapter(DeliverySemantic).dump_python(at_most_once)
+    with pytest.raises(ValueError, match="cannot have retries"):
+        DeliveryPolicy(semantic=at_most_once, max_retries=3)
+
+    dedup_without_ack = DeliverySemantic(
+        id="dedup", name="Dedup", description="Deduplicated",
+        requires_ack=False, allows_retry=True, preserves_order=False, requires_dedup=True
+    )
+    with pytest.raises(ValueError, match="requires acknowledgment"):
+        DeliveryPolicy(semantic=dedup_without_ack)
+
+def test_message_field_validation():
+    """Message level, target type and direction are validated on creation"""
+    fields = dict(id="msg-1", title="Title", content="Content", source="test")
+    assert Message(level="info", **fields).target_type is None
+    assert Message(level=MessageLevel.WARNING, target_type=MessageTarget.GLOBAL, **fields).level == "warning"
+    assert MessageLevel.is_valid("error") and not MessageTarget.is_valid("error")
+    assert Message(level="error", target_type="action", direction="inbound", **fields).level == "error"
+    with pytest.raises(ValueError, match="Invalid message level"):
+        Message(level="debug", **fields)
+    with pytest.raises(ValueError, match="Invalid target type"):
+        Message(level="info", target_type="nowhere", **fields)
+    with pytest.raises(ValueError, match="Invalid direction"):
+        Message(level="info", direction="sideways", **fields)
+
+def test_shared_types_have_one_definition():
+    """Re-exported domain types are the same class wherever they are imported from"""
+    from ..domain import base, metadata, metrics, publishers, subscriptions
+    assert metadata.Metric is metrics.Metric is base.Metric is Metric
+    assert subscriptions.Publisher is publishers.Publisher
+
+def test_metrics_serialize_as_objects():
+    """Metrics keep their object shape in JSON output"""
+    from pydantic import TypeAdapter
+    from typing import List
+    assert TypeAdapter(List[Metric]).dump_json([Metric(name="a", value=1.0)]) == (
+        b'[{"name":"a","value":1.0,"description":null}]'
+    )
+
+def test_inbound_message_payload_decoded_lazily():
+    """Raw JSON payloads are only decoded when the dict is asked for"""
+    from ..domain.messages import InboundMessageRequest
+    request = InboundMessageRequest(endpoint="/hooks/1", payload=b'{"id": 1}')
+    assert request.payload == b'{"id": 1}'
+    assert request.payload_dict() == {"id": 1}
+    assert request.payload_dict() is request.payload_dict()
+    assert InboundMessageRequest(endpoint="/hooks/1", payload={"id": 2}).payload_dict() == {"id": 2}
+
+def test_result_sequences_default_to_empty_tuples():
+    """Optional result sequences default to a shared empty tuple"""
+    from ..domain.messages import WorkerProcessingResponse
+    from ..domain.validation import ValidationResult
+    response = WorkerProcessingResponse(message_id="m", processing_id="p", status="processed")
+    assert response.next_actions == ()
+    assert WorkerProcessingResponse(
+        message_id="m", processing_id="p", status="processed", next_actions=["notify"]
+    ).next_actions == ("notify",)
+    assert WorkerProcessingResponse(
+        message_id="m", processing_id="p", status="processed", next_actions=None
+    ).next_actions == ()
+    assert ValidationResult(success=True).errors == ()
+    assert ValidationResult(success=False, errors=["bad"]).errors == ("bad",)
+
+def test_private_slots_are_not_fields():
+    """Cached private slots stay out of dataclass fields and serialized output"""
+    import pickle
+    from dataclasses import fields
+    from pydantic import TypeAdapter
+    from ..domain import ValidationRule
+    rule = ValidationRule(rule_type="pattern", value="^https://")
+    assert [f.name for f in fields(rule)] == ["rule_type", "value", "message"]
+    assert TypeAdapter(ValidationRule).dump_python(rule) == {
+        "rule_type": "pattern", "value": "^https://", "message": None
+    }
+    copied = pickle.loads(pickle.dumps(rule))
+    assert copied == rule and copied._pattern.match("https://example.com")
@@ -0,0 +1,131 @@
+import imaplib
+from datetime import datetime
+from unittest.mock import Mock, patch
+from ..protocols.email import protocol as email_protocol
+from ..protocols.email.protocol import EmailProtocol
+
+CONFIG = {
+    "host": "imap.example.test",
+    "username": "user",
+    "password": "secret",
+    "folder": "INBOX"
+}
+
+def _fake_client(search=b"", fetch=None):
+    """IMAP client double answering UID SEARCH/FETCH/STORE"""
+    client = Mock()
+    client.select.return_value = ("OK", [b"0"])
+    responses = {
+        "SEARCH": ("OK", [search]),
+        "FETCH": ("OK", fetch or []),
+        "STORE": ("OK", [])
+    }
+    client.uid.side_effect = lambda command, *args: responses[command]
+    return client
+
+def test_email_execute_reuses_pooled_connection():
+    """Consecutive executes share one logged-in IMAP session"""
+    email_protocol._IMAP_POOL.clear()
+    client = _fake_client()
+    handler = EmailProtocol(CONFIG)
+    action = Mock(id="email-1", config={})
+
+    with patch.object(EmailProtocol, "_get_connection", return_value=client) as connect:
+        assert handler.execute(action).success
+        assert EmailProtocol(CONFIG).execute(action).success
+
+    assert connect.call_count == 1
+    client.noop.assert_called_once()
+    email_protocol._IMAP_POOL.clear()
+
+def test_email_execute_drops_broken_connection():
+    """A session that aborts is not returned to the pool"""
+    email_protocol._IMAP_POOL.clear()
+    client = _fake_client()
+    client.uid.side_effect = imaplib.IMAP4.abort("connection lost")
+    handler = EmailProtocol(CONFIG)
+
+    with patch.object(EmailProtocol, "_get_connection", return_value=client):
+        assert not handler.execute(Mock(id="email-2", config={})).success
+
+    client.logout.assert_called_once()
+    assert not any(email_protocol._IMAP_POOL.values())
+
+def test_email_pool_expires_and_caps_idle_connections():
+    """Stale idle sessions are logged out and idle sessions per account are capped"""
+    email_protocol._IMAP_POOL.clear()
+    stale, fresh = _fake_client(), _fake_client()
+    action = Mock(id="email-4", config={})
+
+    with patch.object(EmailProtocol, "_get_connection", return_value=stale):
+        assert EmailProtocol(CONFIG).execute(action).success
+    (key, idle), = email_protocol._IMAP_POOL.items()
+    assert CONFIG["password"] not in key
+    idle[0] = (stale, idle[0][1] - email_protocol._IMAP_IDLE_TIMEOUT - 1)
+
+    with patch.object(EmailProtocol, "_get_connection", return_value=fresh) as connect:
+        assert EmailProtocol(CONFIG).execute(action).success
+    connect.assert_called_once()
+    stale.logout.assert_called_once()
+    stale.noop.assert_not_called()
+
+    extras = [_fake_client() for _ in range(email_protocol._IMAP_MAX_IDLE_PER_KEY)]
+    with patch.object(EmailProtocol, "_get_connection", side_effect=extras):
+        handler = EmailProtocol(CONFIG)
+        with handler._pooled_connection(), handler._pooled_connection():
+            with handler._pooled_connection(), handler._pooled_connection():
+                with handler._pooled_connection():
+                    pass
+    assert len(email_protocol._IMAP_POOL[key]) == email_protocol._IMAP_MAX_IDLE_PER_KEY
+
+    email_protocol.close_idle_connections()
+    assert not email_protocol._IMAP_POOL
+    assert all(c.logout.call_count == 1 for c in [fresh, *extras])
+
+def test_email_execute_fetches_matches_in_one_batch():
+    """All matching messages are fetched and flagged with one UID command each"""
+    email_protocol._IMAP_POOL.clear()
+    client = _fake_client(search=b"103 107", fetch=[
+        (b"3 (UID 103 BODY[] {40}", b"Subject: first\r\nFrom: a@example.test\r\n\r\none"),
+        b")",
+        (b"7 (UID 107 BODY[] {41}", b"Subject: second\r\nFrom: b@example.test\r\n\r\ntwo"),
+        b")"
+    ])
+    handler = EmailProtocol(CONFIG)
+
+    with patch.object(EmailProtocol, "_get_connection", return_value=client):
+        result = handler.execute(Mock(id="email-3", config={}))
+
+    assert result.success
+    assert [m["id"] for m in result.result["messages"]] == ["103", "107"]
+    assert result.result["messages"][1]["subject"] == "second"
+    commands = [c.args[:2] for c in client.uid.call_args_list]
+    assert commands == [("SEARCH", None), ("FETCH", b"103,107"), ("STORE", b"103,107")]
+    email_protocol._IMAP_POOL.clear()
+
+def test_email_search_criteria_are_quoted():
+    """Text criteria are quoted and date bounds go to the server"""
+    criteria = EmailProtocol(CONFIG)._build_search_criteria({
+        "subject": 'Weekly "status" report',
+        "since": datetime(2024, 1, 5),
+        "before": "10-Jan-2024"
+    })
+    assert criteria == [
+        "SUBJECT", '"Weekly \\"status\\" report"',
+        "SINCE", "05-Jan-2024",
+        "BEFORE", "10-Jan-2024"
+    ]
+
+def test_email_body_prefers_plain_text_part():
+    """Multipart messages yield their decoded text/plain body"""
+    raw = (
+        b"Subject: multi\r\n"
+        b"MIME-Version: 1.0\r\n"
+        b'Content-Type: multipart/alternative; boundary="b"\r\n\r\n'
+        b"--b\r\nContent-Type: text/html; charset=utf-8\r\n\r\n<p>html</p>\r\n"
+        b"--b\r\nContent-Type: text/plain; charset=utf-8\r\n"
+        b"Content-Transfer-Encoding: quoted-printable\r\n\r\ncaf=C3=A9\r\n"
+        b"--b--\r\n"
+    )
+    message = email_protocol._PARSER.parsebytes(raw)
+    assert EmailProtocol(CONFIG)._get_message_body(message).strip() == "café"
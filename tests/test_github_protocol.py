@@ -1,6 +1,6 @@
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from ..protocols.github import GithubProtocol
 from ..domain import (
     Action, ActionType, Protocol, ConfigValue,
@@ -52,46 +52,47 @@ def test_github_template_loading(catalogue):
 
 def test_github_issue_creation(catalogue):
     """Test GitHub issue creation flow"""
-    with patch('httpx.post') as mock_post:
-        mock_post.return_value.status_code = 201
-        mock_post.return_value.json.return_value = {
-            "number": 1,
-            "html_url": "https://github.com/test-org/test-repo/issues/1"
-        }
-        
-        protocol = catalogue.get_protocol("github")
-        action = Action(
-            id="test-1",
-            name="Create Test Issue",
-            description="Test issue creation",
-            action_type=catalogue.get_action_type("publish"),
-            protocol=protocol,
-            config=[
-                ConfigValue(name="repo_owner", value="test-org"),
-                ConfigValue(name="repo_name", value="test-repo"),
-                ConfigValue(name="title", value="Test Issue"),
-                ConfigValue(name="body", value="Test content"),
-                ConfigValue(name="labels", value=["bug"]),
-                ConfigValue(name="assignees", value=["testuser"]),
-                ConfigValue(name="token", value="ghp_test123")
-            ],
-            schema=ProtocolConfigSchema(
-                properties={
-                    "repo_owner": PropertyDefinition(type="str"),
-                    "repo_name": PropertyDefinition(type="str"),
-                    "title": PropertyDefinition(type="str"),
-                    "body": PropertyDefinition(type="str"),
-                    "labels": PropertyDefinition(type="list"),
-                    "assignees": PropertyDefinition(type="list"),
-                    "token": PropertyDefinition(type="str")
-                },
-                required=["repo_owner", "repo_name", "title", "token"]
-            ),
-            delivery_policy=protocol.default_policy
-        )
-        
-        protocol = GithubProtocol(action.config)
-        result = protocol.execute(action)
-        
-        assert result.success == True
-        assert result.result["status"] == "created"
+    client = Mock()
+    client.post.return_value.status_code = 201
+    client.post.return_value.json.return_value = {
+        "number": 1,
+        "html_url": "https://github.com/test-org/test-repo/issues/1"
+    }
+    
+    protocol = catalogue.get_protocol("github")
+    action = Action(
+        id="test-1",
+        name="Create Test Issue",
+        description="Test issue creation",
+        action_type=catalogue.get_action_type("publish"),
+        protocol=protocol,
+        config=[
+            ConfigValue(name="repo_owner", value="test-org"),
+            ConfigValue(name="repo_name", value="test-repo"),
+            ConfigValue(name="title", value="Test Issue"),
+            ConfigValue(name="body", value="Test content"),
+            ConfigValue(name="labels", value=["bug"]),
+            ConfigValue(name="assignees", value=["testuser"]),
+            ConfigValue(name="token", value="ghp_test123")
+        ],
+        schema=ProtocolConfigSchema(
+            properties={
+                "repo_owner": PropertyDefinition(type="str"),
+                "repo_name": PropertyDefinition(type="str"),
+                "title": PropertyDefinition(type="str"),
+                "body": PropertyDefinition(type="str"),
+                "labels": PropertyDefinition(type="list"),
+                "assignees": PropertyDefinition(type="list"),
+                "token": PropertyDefinition(type="str")
+            },
+            required=["repo_owner", "repo_name", "title", "token"]
+        ),
+        delivery_policy=protocol.default_policy
+    )
+    
+    protocol = GithubProtocol(action.config, client=client)
+    result = protocol.execute(action)
+    
+    assert result.success == True
+    assert result.result["status"] == "created"
+    client.post.assert_called_once()
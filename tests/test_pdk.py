@@ -87,6 +87,18 @@ def test_protocol_config_validation_success():
     assert handler.validate_config() == True
     assert handler.last_error is None
 
+def test_protocol_config_nested_values_are_not_shared():
+    """Mutating a nested config value does not change later reads"""
+    handler = ExampleTestProtocol({
+        "url": "http://test.com",
+        "headers": {"Authorization": "Bearer token"}
+    })
+    handler.config["headers"]["Authorization"] = "Bearer other"
+    assert handler.config["headers"] == {"Authorization": "Bearer token"}
+
+    scalar_only = ExampleTestProtocol({"url": "http://test.com", "method": "GET"})
+    assert scalar_only.config is scalar_only.config
+
 def test_protocol_config_validation_failure():
     """Test failed config validation"""
     handler = ExampleTestProtocol({
@@ -255,3 +267,13 @@ def test_protocol_config_immutability():
     
     # Verify config unchanged
     assert handler.config["url"] == "http://test.com"
+
+def test_protocol_handlers_share_config_model():
+    """Handlers with the same config layout reuse one config model"""
+    first = ExampleTestProtocol({"url": "http://a.test", "method": "GET"})
+    second = ExampleTestProtocol({"url": "http://b.test", "method": "POST"})
+    other = ExampleTestProtocol({"url": "http://c.test"})
+
+    assert type(first._config) is type(second._config)
+    assert type(first._config) is not type(other._config)
+    assert second.config["method"] == "POST"
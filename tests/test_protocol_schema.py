@@ -1,5 +1,8 @@
+from dataclasses import fields
+from enum import IntEnum
 import pytest
-from ..domain import ProtocolConfigSchema, PropertyDefinition
+from pydantic import TypeAdapter
+from ..domain import ProtocolConfig, ProtocolConfigSchema, PropertyDefinition, ValidationRule, ConfigValue
 
 def test_protocol_config_schema_creation():
     """Test creating valid protocol config schemas"""
@@ -15,6 +18,7 @@ def test_protocol_config_schema_creation():
     )
     assert schema.description == 'Test schema'
     assert 'url' in schema.required
+    assert [f.name for f in fields(schema)] == ['properties', 'required', 'description']
     
     # Schema with missing required field
     with pytest.raises(ValueError) as exc:
@@ -76,3 +80,185 @@ def test_protocol_config_validation():
             'invalid': 'value'
         })
     assert "Unknown field" in str(exc.value)
+
+
+def test_protocol_config_validation_rules():
+    """Test validation rules compiled into the schema"""
+    schema = ProtocolConfigSchema(
+        properties={
+            'method': PropertyDefinition(
+                type="str",
+                validation_rules=[ValidationRule(rule_type="choices", value=["GET", "POST"])]
+            ),
+            'timeout': PropertyDefinition(
+                type="int",
+                validation_rules=[ValidationRule(rule_type="range", value=(1, 60), message="Timeout out of range")]
+            ),
+            'path': PropertyDefinition(
+                type="str",
+                validation_rules=[ValidationRule(rule_type="pattern", value=r"^/")]
+            )
+        },
+        required=['method']
+    )
+
+    schema.validate_config({'method': 'GET', 'timeout': 30, 'path': '/hooks'})
+
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config({'method': 'DELETE'})
+    assert "Field method failed validation rule: choices" in str(exc.value)
+
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config({'method': 'GET', 'timeout': 90})
+    assert "Timeout out of range" in str(exc.value)
+
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config({'method': 'GET', 'path': 'hooks'})
+    assert "Field path failed validation rule: pattern" in str(exc.value)
+
+    # Unsupported property types are rejected when the schema is built
+    with pytest.raises(ValueError) as exc:
+        ProtocolConfigSchema(properties={'url': PropertyDefinition(type="url")}, required=[])
+    assert "unsupported type" in str(exc.value)
+
+def test_protocol_config_validation_checks_failing_fields_first():
+    """Test that frequently failing fields are checked first"""
+    schema = ProtocolConfigSchema(
+        properties={
+            'url': PropertyDefinition(type="str"),
+            'timeout': PropertyDefinition(type="int")
+        },
+        required=[]
+    )
+    config = {'url': 1, 'timeout': '30'}
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config(config)
+    assert "Field url must be of type str" in str(exc.value)
+
+    for _ in range(64):
+        with pytest.raises(ValueError):
+            schema.validate_config({'timeout': '30'})
+
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config(config)
+    assert "Field timeout must be of type int" in str(exc.value)
+
+def test_protocol_config_validation_cache():
+    """Test that repeated validation of a config is remembered"""
+    schema = ProtocolConfigSchema(
+        properties={
+            'enabled': PropertyDefinition(type="bool"),
+            'headers': PropertyDefinition(type="dict")
+        },
+        required=[]
+    )
+    schema.validate_config({'enabled': True})
+    schema.validate_config({'enabled': True})
+
+    # 1 == True, but a cached bool config must not let an int through
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config({'enabled': 1})
+    assert "Field enabled must be of type bool" in str(exc.value)
+
+    # Unhashable values fall back to uncached validation
+    schema.validate_config({'headers': {'Accept': 'application/json'}})
+    with pytest.raises(ValueError):
+        schema.validate_config({'headers': ['Accept']})
+
+def test_property_definition_is_hashable():
+    """Test that list arguments are stored as tuples"""
+    prop = PropertyDefinition(
+        type="str",
+        validation_rules=[ValidationRule(rule_type="pattern", value=r"^/")]
+    )
+    assert isinstance(prop.validation_rules, tuple)
+    assert hash(prop) == hash(PropertyDefinition(
+        type="str",
+        validation_rules=(ValidationRule(rule_type="pattern", value=r"^/"),)
+    ))
+
+    schema = ProtocolConfigSchema(properties={'path': prop}, required=['path'])
+    assert schema.required == ('path',)
+
+def test_identical_schemas_share_compiled_checks():
+    """Test that identical schemas are only checked and compiled once"""
+    def build():
+        return ProtocolConfigSchema(
+            properties={'url': PropertyDefinition(type="str"), 'timeout': PropertyDefinition(type="int")},
+            required=['url']
+        )
+    first, second = build(), build()
+    assert first._compiled is second._compiled
+
+    # Failure statistics stay per schema instance
+    with pytest.raises(ValueError):
+        first.validate_config({'url': 1})
+    assert second._fail_counts['url'] == 0
+
+def test_protocol_config_validation_same_object():
+    """Test that a mutated config object is validated again"""
+    schema = ProtocolConfigSchema(
+        properties={'headers': PropertyDefinition(type="dict"), 'timeout': PropertyDefinition(type="int")},
+        required=[]
+    )
+    config = {'headers': {}, 'timeout': 30}
+    schema.validate_config(config)
+    schema.validate_config(config)
+
+    config['timeout'] = '30'
+    with pytest.raises(ValueError):
+        schema.validate_config(config)
+
+    config['timeout'] = 30
+    schema.validate_config(config)
+    config['unknown'] = 1
+    with pytest.raises(ValueError):
+        schema.validate_config(config)
+
+def test_protocol_config_validation_rejects_bool_for_int():
+    """Test that booleans are not accepted as integers"""
+    schema = ProtocolConfigSchema(properties={'timeout': PropertyDefinition(type="int")}, required=[])
+    schema.validate_config({'timeout': 30})
+    with pytest.raises(ValueError) as exc:
+        schema.validate_config({'timeout': True})
+    assert "Field timeout must be of type int" in str(exc.value)
+
+    # Other int subclasses are still accepted
+    class Seconds(IntEnum):
+        SHORT = 5
+    schema.validate_config({'timeout': Seconds.SHORT})
+
+def test_protocol_config_lookup():
+    """Test validated protocol config values are available by name"""
+    schema = ProtocolConfigSchema(properties={'url': PropertyDefinition(type="str")}, required=['url'])
+    config = ProtocolConfig(values=[ConfigValue(name="url", value="https://example.com")], schema=schema)
+    assert config.get('url') == "https://example.com"
+    assert config.get('missing', 'default') == 'default'
+    assert dict(config.as_dict()) == {'url': "https://example.com"}
+    assert [f.name for f in fields(config)] == ['values', 'schema']
+    with pytest.raises(TypeError):
+        config.as_dict()['url'] = "https://other.example.com"
+
+def test_protocol_config_schema_properties_are_copied():
+    """Test that edits to the caller's properties dict do not reach the schema"""
+    properties = {'url': PropertyDefinition(type="str")}
+    schema = ProtocolConfigSchema(properties=properties, required=['url'])
+    properties['extra'] = PropertyDefinition(type="int")
+    assert list(schema.properties) == ['url']
+    with pytest.raises(ValueError):
+        schema.validate_config({'url': "https://example.com", 'extra': 1})
+    assert TypeAdapter(ProtocolConfigSchema).dump_python(schema) == {
+        'properties': {'url': {'type': "str", 'description': None, 'default': None, 'required': False, 'validation_rules': ()}},
+        'required': ('url',),
+        'description': None,
+    }
+
+def test_protocol_config_rejects_duplicate_values():
+    """Test that a config value name can only be given once"""
+    schema = ProtocolConfigSchema(properties={'url': PropertyDefinition(type="str")}, required=['url'])
+    with pytest.raises(ValueError) as exc:
+        ProtocolConfig(
+            values=[ConfigValue(name="url", value="https://a.example.com"), ConfigValue(name="url", value="https://b.example.com")],
+            schema=schema
+        )
+    assert "Duplicate field: url" in str(exc.value)
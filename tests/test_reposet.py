@@ -3,7 +3,7 @@ import pytest
 from types import MappingProxyType
 from typing import Dict, Any
 
-from ..base_settings import create_reposet, get_base_reposet
+from ..base_settings import create_reposet, get_base_reposet, get_mutable_base_reposet
 from ..repositories.memory import (
     InMemoryWebhookRepository,
     InMemoryEventRepository,
@@ -95,3 +95,14 @@ class TestRepoSet:
         
         # Should return same instance
         assert repos1 is repos2
+
+    def test_base_reposet_is_immutable(self):
+        """Should share an immutable base reposet and hand out mutable copies"""
+        repos = get_base_reposet()
+        with pytest.raises(TypeError):
+            repos["webhook_repository"] = None
+
+        mutable = get_mutable_base_reposet()
+        mutable["webhook_repository"] = None
+        assert repos["webhook_repository"] is not None
+        assert mutable["event_repository"] is repos["event_repository"]
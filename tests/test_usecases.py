@@ -329,6 +329,27 @@ def test_ordered_delivery():
     assert all(r.delivery_pattern == "ordered" for r in requests)
     assert all(r.ordering_key == "test-group" for r in requests)
 
+def test_delivery_configs_are_typed():
+    """Batch and response configs validate against their own models"""
+    request = ExecuteActionRequest(
+        action_id="typed-1",
+        content={"data": "test"},
+        correlation_id="typed-001",
+        batch_config={"size": 10},
+        response_config={"timeout": 5}
+    )
+    assert request.batch_config.size == 10
+    assert "window" not in request.batch_config
+    assert request.response_config["timeout"] == 5
+
+    with pytest.raises(ValidationError):
+        ExecuteActionRequest(
+            action_id="typed-2",
+            content={"data": "test"},
+            correlation_id="typed-002",
+            batch_config={"size": 10, "unknown": True}
+        )
+
 def test_response_processing():
     """Test response handling"""
     response = ActionStatusResponse(
@@ -387,3 +408,51 @@ def test_action_validation():
             correlation_id="corr-1"
             # Missing required 'content' field
         )
+
+def test_message_request_length_limits():
+    """Message title and content lengths are enforced by the schema"""
+    from ..interfaces.requests import CreateSystemMessageRequest, UpdateMessageRequest
+
+    with pytest.raises(ValidationError):
+        CreateSystemMessageRequest(
+            title="x" * 201, content="body", level="info", source="test"
+        )
+    with pytest.raises(ValidationError):
+        UpdateMessageRequest(message_id="m1", content="x" * 5001)
+    assert UpdateMessageRequest(message_id="m1").title is None
+
+def test_callback_payload_keeps_extra_keys():
+    """Callback payloads stay plain dicts with a strictly numeric confidence"""
+    request = ActionCallbackRequest(
+        protocol_id="http",
+        action_type_id="fetch",
+        payload={"detected_threat": "fox", "confidence": 1, "zone": {"id": 3}}
+    )
+    assert request.payload == {"detected_threat": "fox", "confidence": 1, "zone": {"id": 3}}
+    assert type(request.payload["confidence"]) is int
+
+    # Booleans pass through unchanged, as the original validator allowed
+    assert ActionCallbackRequest(
+        protocol_id="http", action_type_id="fetch", payload={"confidence": True}
+    ).payload["confidence"] is True
+
+    for confidence in ("0.5", 1.5):
+        with pytest.raises(ValidationError):
+            ActionCallbackRequest(
+                protocol_id="http",
+                action_type_id="fetch",
+                payload={"confidence": confidence}
+            )
+
+def test_message_request_levels_are_enums():
+    """Message levels and targets validate to the domain enums"""
+    from ..interfaces.requests import CreateSystemMessageRequest
+    from ..domain import MessageLevel, MessageTarget
+
+    request = CreateSystemMessageRequest(
+        title="t", content="c", level="warning", source="test", target_type="action"
+    )
+    assert request.level is MessageLevel.WARNING
+    assert request.target_type is MessageTarget.ACTION
+    with pytest.raises(ValidationError):
+        CreateSystemMessageRequest(title="t", content="c", level="fatal", source="test")
@@ -115,7 +115,7 @@ class ProcessInboundMessage:
                 processing_id=str(uuid.uuid4()),
                 status="processed",
                 result=result,
-                next_actions=result.get("next_actions", [])
+                next_actions=result.get("next_actions", ())
             )
 
         except Exception as e:
@@ -298,7 +298,8 @@ class CreateAction:
             output_template=request.output_template
         )
         
-        return ActionResponse(
+        # The action comes from our own repository, so skip re-validating it
+        return ActionResponse.model_construct(
             action=action,
             status="created",
             message="Action created successfully"
@@ -339,7 +340,8 @@ class ListActions:
             protocol=protocol_obj
         )
         
-        return ActionListResponse(
+        # Repository rows are trusted; model_construct skips per-item validation
+        return ActionListResponse.model_construct(
             actions=actions,
             total=len(actions)
         )
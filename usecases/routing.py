@@ -30,13 +30,8 @@ class RouteMessage:
                     destinations.append(rule.destination)
                     
         elif self.routing_config.strategy == "priority":
-            # Sort by priority and return first match
-            sorted_rules = sorted(
-                self.routing_config.rules,
-                key=lambda r: r.priority,
-                reverse=True
-            )
-            for rule in sorted_rules:
+            # Return first match in precomputed priority order
+            for rule in self.routing_config.rules_by_priority:
                 if self._evaluate_condition(rule):
                     destinations.append(rule.destination)
                     break
@@ -55,7 +50,7 @@ class RouteMessage:
         # TODO: Implement condition evaluation
         return False
 """Routing-related usecases"""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from ..domain import Action, RoutingRule, RoutingConfiguration
 from ..interfaces.repositories import ActionRepository, EventRepository
 
@@ -66,36 +61,26 @@ class RouteMessage:
         self.action_repo = action_repo
         self.event_repo = event_repo
         
-    def execute(self, message: Dict[str, Any], rules: List[RoutingRule]) -> List[str]:
+    def execute(
+        self,
+        message: Dict[str, Any],
+        rules: Union[List[RoutingRule], RoutingConfiguration]
+    ) -> List[str]:
         """Route message and return list of destination IDs"""
         destinations = []
         
-        for rule in sorted(rules, key=lambda r: r.priority, reverse=True):
-            if self._evaluate_condition(rule.condition, message):
+        if isinstance(rules, RoutingConfiguration):
+            ordered = rules.rules_by_priority
+        else:
+            ordered = sorted(rules, key=lambda r: r.priority, reverse=True)
+        for rule in ordered:
+            if rule.matches(message):
                 destinations.append(rule.destination)
                 if rule.config.get("stop_processing", False):
                     break
                     
         return destinations
         
-    def _evaluate_condition(self, condition: Optional[str], message: Dict[str, Any]) -> bool:
-        """Evaluate routing condition against message"""
-        if not condition:
-            return True
-            
-        # Simple condition evaluation for now
-        # Could be enhanced with proper expression parsing
-        try:
-            # Get value from message using dot notation
-            parts = condition.split('.')
-            value = message
-            for part in parts:
-                value = value[part]
-                
-            return bool(value)
-        except:
-            return False
-
 class ValidateRouting:
     """Validate routing configuration"""
     
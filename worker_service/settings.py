@@ -3,7 +3,7 @@ from functools import lru_cache
 import os
 
 from ..types import RepoSet
-from ..base_settings import get_base_reposet, validate_base_settings
+from ..base_settings import get_mutable_base_reposet, validate_base_settings
 from ..repositories.behaviour import HardcodedBehaviourCatalogue
 
 # Map protocols to their repository implementations
@@ -25,7 +25,7 @@ PROTOCOL_REPOSITORIES = {
 @lru_cache()
 def get_reposet() -> RepoSet:
     """Get repository set for worker, extending base repos"""
-    repos = dict(get_base_reposet())  # Convert to mutable dict
+    repos = get_mutable_base_reposet()
     
     # Add worker-specific repositories
     repos["behaviour_repository"] = HardcodedBehaviourCatalogue()